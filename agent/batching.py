@@ -0,0 +1,97 @@
+"""
+LLM Request Batching
+====================
+
+Coalesces concurrent LLM calls into one llm.abatch() call.
+
+Key Concepts:
+-------------
+1. Each caller submits its messages and awaits a future
+2. A background task drains up to max_batch requests, waiting at most
+   `window` seconds for stragglers, and sends them together
+3. Each future is resolved with its own response text (or exception)
+
+Why batch?
+----------
+Under bursty load, N concurrent users would otherwise mean N separate
+round-trips set up one by one. abatch() sends them together (up to
+max_batch in flight), so the burst costs roughly one round-trip of
+wall-clock time.
+
+Example:
+--------
+    >>> batcher = LLMBatcher(get_llm, max_batch=16, window=0.005)
+    >>> text = await batcher.submit([SystemMessage(...), HumanMessage(...)])
+"""
+
+import asyncio
+from typing import Any, Callable, List
+
+
+class LLMBatcher:
+    """
+    Coalesces concurrent requests to one LLM into llm.abatch() calls.
+
+    The queue and worker are bound to the running event loop and rebuilt
+    if the loop changes (e.g. a sync wrapper calling asyncio.run).
+
+    Args:
+        get_llm: Zero-argument callable returning the LLM (called per batch,
+            so a cached getter is only resolved on first use)
+        max_batch: Max requests sent in one abatch() call
+        window: Seconds to wait for more requests to join a batch
+    """
+
+    def __init__(self, get_llm: Callable[[], Any], max_batch: int, window: float):
+        self._get_llm = get_llm
+        self.max_batch = max_batch
+        self.window = window
+        self._loop = None
+        self._queue = None
+        self._worker = None
+
+    async def submit(self, messages: List[Any]) -> str:
+        """Queue one prompt (list of messages) and return the response text."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+
+        future = loop.create_future()
+        await self._queue.put((messages, future))
+        return await future
+
+    async def _run(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                responses = await self._get_llm().abatch(
+                    [messages for messages, _ in batch],
+                    config={"max_concurrency": self.max_batch},
+                    return_exceptions=True
+                )
+            except Exception as e:
+                responses = [e] * len(batch)
+
+            for (_, future), response in zip(batch, responses):
+                if future.done():
+                    continue  # Caller went away (cancelled)
+                if isinstance(response, BaseException):
+                    future.set_exception(response)
+                else:
+                    future.set_result(response.content)
+
+
+__all__ = ["LLMBatcher"]
@@ -24,29 +24,31 @@ Simple, right? Just one node for now!
 Later projects will have multiple nodes with conditional routing.
 """
 
+import functools
+import logging
 from langgraph.graph import StateGraph, END
 from typing import Callable
 
-from .state import AgentState, PropalystState
+from .state import AgentState, PropalystState, create_initial_state
 from .nodes.ui_extractor import extract_ui_component
-from .nodes.propalyst_qa import (
-    ask_work_location,
-    ask_kids,
-    ask_commute,
-    ask_property_type,
-    ask_budget
-)
+from .nodes.propalyst_qa import ask_next, next_unanswered_field
 from .nodes.calculate_areas import calculate_recommended_areas
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # GRAPH CREATION
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def create_ui_generator_graph() -> Callable:
     """
     Creates and compiles the LangGraph workflow.
 
+    The compiled graph is cached: the graph definition never changes
+    between requests, so it is built and compiled only once per process.
+
     Steps:
     ------
     1. Create StateGraph with AgentState type
@@ -223,16 +225,11 @@ async def run_graph(user_input: str) -> AgentState:
         >>> print(result["component"].type)
         "Button"
     """
-    # Create the graph
+    # Get the compiled graph (built once, then reused)
     app = create_ui_generator_graph()
 
     # Create initial state
-    initial_state = AgentState(
-        user_input=user_input,
-        component=None,
-        message="",
-        error=None
-    )
+    initial_state = create_initial_state(user_input)
 
     # Run the graph
     final_state = await app.ainvoke(initial_state)
@@ -288,12 +285,9 @@ def route_propalyst(state: PropalystState) -> str:
 
     Decision logic:
     ---------------
-    1. Check Q1 (work_location) - if missing, ask
-    2. Check Q2 (has_kids) - if missing, ask
-    3. Check Q3 (commute_time_max) - if missing, ask
-    4. Check Q4 (property_type) - if missing, ask
-    5. Check Q5 (budget_max) - if missing, ask
-    6. If all answered → END (for now, will add calculator later)
+    1. If any of Q1-Q5 is missing → ask_next (asks the first missing one)
+    2. If all answered and not calculated → calculate_areas
+    3. Otherwise → END
 
     Args:
         state: Current PropalystState
@@ -304,59 +298,46 @@ def route_propalyst(state: PropalystState) -> str:
     Examples:
         >>> state = {"work_location": None, ...}
         >>> route_propalyst(state)
-        "ask_work_location"
+        "ask_next"
 
-        >>> state = {"work_location": "Whitefield", "has_kids": None, ...}
+        >>> state = {"work_location": "Whitefield", ..., "budget_max": 80000, "calculated": False}
         >>> route_propalyst(state)
-        "ask_kids"
+        "calculate_areas"
     """
 
-    print("\n🎯 ROUTER: Deciding next step...")
-    print(f"   State: work_location={state.get('work_location')}, "
-          f"has_kids={state.get('has_kids')}, "
-          f"commute={state.get('commute_time_max')}, "
-          f"type={state.get('property_type')}, "
-          f"budget={state.get('budget_max')}")
-
-    # Q1: Work location
-    if not state.get("work_location"):
-        print("   → Missing work_location, going to ask_work_location")
-        return "ask_work_location"
-
-    # Q2: Kids
-    if state.get("has_kids") is None:
-        print("   → Missing has_kids, going to ask_kids")
-        return "ask_kids"
-
-    # Q3: Commute
-    if not state.get("commute_time_max"):
-        print("   → Missing commute_time_max, going to ask_commute")
-        return "ask_commute"
-
-    # Q4: Property type
-    if not state.get("property_type"):
-        print("   → Missing property_type, going to ask_property_type")
-        return "ask_property_type"
-
-    # Q5: Budget
-    if not state.get("budget_max"):
-        print("   → Missing budget_max, going to ask_budget")
-        return "ask_budget"
+    get = state.get
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "ROUTER state: work_location=%s, has_kids=%s, commute=%s, type=%s, budget=%s",
+            get("work_location"), get("has_kids"), get("commute_time_max"),
+            get("property_type"), get("budget_max")
+        )
+
+    # Q1-Q5: any question still unanswered?
+    field = next_unanswered_field(state)
+    if field is not None:
+        logger.debug("ROUTER: missing %s -> ask_next", field)
+        return "ask_next"
 
     # All questions answered - calculate recommended areas
-    if not state.get("calculated"):
-        print("   → All questions answered! Calculating areas...")
+    if not get("calculated"):
+        logger.debug("ROUTER: all questions answered -> calculate_areas")
         return "calculate_areas"
 
     # All done (areas calculated)
-    print("   → Areas calculated! Going to END")
+    logger.debug("ROUTER: areas calculated -> end")
     return "end"
 
 
+@functools.lru_cache(maxsize=1)
 def create_propalyst_graph() -> Callable:
     """
     Creates the Propalyst Q&A conversation graph.
 
+    Like create_ui_generator_graph(), the compiled graph is cached and
+    reused across requests.
+
     This graph handles the multi-step conversation:
     Q1 → Q2 → Q3 → Q4 → Q5 → END
 
@@ -369,11 +350,12 @@ def create_propalyst_graph() -> Callable:
                       ↓
                 [ROUTER] ← Checks what's missing
                       ↓
-            ┌─────────┼─────────┐
-            │         │         │
-       [Q1:work] [Q2:kids] [Q3:commute] ...
-            │         │         │
-            └─────────┴─────────┘
+            ┌─────────┴─────────┐
+            │                   │
+       [ask_next]       [calculate_areas]
+       (Q1..Q5)                 │
+            │                   │
+            └─────────┬─────────┘
                       ↓
                     END
 
@@ -396,12 +378,8 @@ def create_propalyst_graph() -> Callable:
     # Create StateGraph with PropalystState
     workflow = StateGraph(PropalystState)
 
-    # Add all Q&A nodes
-    workflow.add_node("ask_work_location", ask_work_location)
-    workflow.add_node("ask_kids", ask_kids)
-    workflow.add_node("ask_commute", ask_commute)
-    workflow.add_node("ask_property_type", ask_property_type)
-    workflow.add_node("ask_budget", ask_budget)
+    # Single Q&A node: asks whichever question is next
+    workflow.add_node("ask_next", ask_next)
 
     # Add calculation node
     workflow.add_node("calculate_areas", calculate_recommended_areas)
@@ -411,24 +389,16 @@ def create_propalyst_graph() -> Callable:
     workflow.set_conditional_entry_point(
         route_propalyst,
         {
-            "ask_work_location": "ask_work_location",
-            "ask_kids": "ask_kids",
-            "ask_commute": "ask_commute",
-            "ask_property_type": "ask_property_type",
-            "ask_budget": "ask_budget",
+            "ask_next": "ask_next",
             "calculate_areas": "calculate_areas",
             "end": END
         }
     )
 
-    # After each node runs, go to END
+    # Both nodes are finish points: after either runs, go to END
     # Don't route back through router (prevents infinite loop)
-    workflow.add_edge("ask_work_location", END)
-    workflow.add_edge("ask_kids", END)
-    workflow.add_edge("ask_commute", END)
-    workflow.add_edge("ask_property_type", END)
-    workflow.add_edge("ask_budget", END)
-    workflow.add_edge("calculate_areas", END)
+    workflow.set_finish_point("ask_next")
+    workflow.set_finish_point("calculate_areas")
 
     # Compile the graph
     app = workflow.compile()
@@ -11,11 +11,99 @@ The node:
 3. Returns top recommended areas
 """
 
-from typing import List, Dict, Any
+import logging
+from typing import Dict, Any, Tuple
 from ..state import PropalystState
 
+logger = logging.getLogger(__name__)
+
+
+# Mock area database
+# Later: Replace with real API/database query
+# Built once at import; never mutated
+_ALL_AREAS: Tuple[Dict[str, Any], ...] = (
+    {
+        "areaName": "Whitefield",
+        "image": "https://images.unsplash.com/photo-1600607687939-ce8a6c25118c?q=80&w=2053",
+        "childFriendlyScore": 9,
+        "schoolsNearby": 12,
+        "averageCommute": "15-20 min",
+        "budgetRange": "₹60K - ₹85K",
+        "highlights": ["IT Hub", "Great Schools", "Metro Access"]
+    },
+    {
+        "areaName": "Marathahalli",
+        "image": "https://images.unsplash.com/photo-1600596542815-ffad4c1539a9?q=80&w=2075",
+        "childFriendlyScore": 8,
+        "schoolsNearby": 10,
+        "averageCommute": "20-25 min",
+        "budgetRange": "₹50K - ₹75K",
+        "highlights": ["Good Connectivity", "Family Friendly", "Shopping"]
+    },
+    {
+        "areaName": "Indiranagar",
+        "image": "https://images.unsplash.com/photo-1613490493576-7fde63acd811?q=80&w=2071",
+        "childFriendlyScore": 7,
+        "schoolsNearby": 8,
+        "averageCommute": "25-30 min",
+        "budgetRange": "₹70K - ₹90K",
+        "highlights": ["Upscale Area", "Parks", "Cafes & Restaurants"]
+    },
+    {
+        "areaName": "Brookefield",
+        "image": "https://images.unsplash.com/photo-1600585154340-be6161a56a0c?q=80&w=2070",
+        "childFriendlyScore": 9,
+        "schoolsNearby": 15,
+        "averageCommute": "10-15 min",
+        "budgetRange": "₹55K - ₹80K",
+        "highlights": ["Close to Whitefield", "Quiet", "Premium Schools"]
+    },
+    {
+        "areaName": "Koramangala",
+        "image": "https://images.unsplash.com/photo-1512917774080-9991f1c4c750?q=80&w=2070",
+        "childFriendlyScore": 7,
+        "schoolsNearby": 9,
+        "averageCommute": "30-35 min",
+        "budgetRange": "₹65K - ₹95K",
+        "highlights": ["Vibrant", "Startups", "Nightlife"]
+    },
+    {
+        "areaName": "HSR Layout",
+        "image": "https://images.unsplash.com/photo-1580587771525-78b9dba3b914?q=80&w=2074",
+        "childFriendlyScore": 8,
+        "schoolsNearby": 11,
+        "averageCommute": "25-30 min",
+        "budgetRange": "₹55K - ₹80K",
+        "highlights": ["Parks", "Shopping", "Well-planned"]
+    }
+)
+
+
+MAX_RECOMMENDATIONS = 6
+
+
+def find_recommended_areas(
+    work_location: str,
+    has_kids: bool,
+    commute_time_max: int,
+    property_type: str,
+    budget_max: int
+) -> Tuple[Dict[str, Any], ...]:
+    """
+    Find recommended areas for a set of user preferences.
 
-def calculate_recommended_areas(state: PropalystState) -> PropalystState:
+    Not cached: the mock selection doesn't depend on the answers yet, so
+    there is nothing worth keying a cache on.
+
+    Returns:
+        Tuple of area dicts (a tuple so the shared catalog can't be mutated)
+    """
+    # Simple filtering logic (mock for now)
+    # Later: Implement real scoring/filtering algorithm
+    return _ALL_AREAS[:MAX_RECOMMENDATIONS]
+
+
+def calculate_recommended_areas(state: PropalystState) -> Dict[str, Any]:
     """
     Calculate recommended areas based on user preferences.
 
@@ -25,7 +113,7 @@ def calculate_recommended_areas(state: PropalystState) -> PropalystState:
         state: Current PropalystState with all Q1-Q5 answers filled
 
     Returns:
-        Updated state with recommended_areas populated
+        State update (only the changed keys); LangGraph merges it into state
 
     Example:
         Input state:
@@ -38,19 +126,19 @@ def calculate_recommended_areas(state: PropalystState) -> PropalystState:
             "calculated": False
         }
 
-        Output state:
+        Returned update:
         {
-            ...same as input...,
             "recommended_areas": [
                 {"areaName": "Whitefield", ...},
                 {"areaName": "Marathahalli", ...}
             ],
-            "calculated": True
+            "calculated": True,
+            "message": "...",
+            "current_step": 6
         }
     """
 
-    print("\n🏘️  CALCULATE AREAS NODE")
-    print("   Calculating recommended areas based on preferences...")
+    logger.debug("CALCULATE AREAS NODE: calculating recommended areas")
 
     # Extract user preferences
     work_location = state.get("work_location", "")
@@ -59,80 +147,19 @@ def calculate_recommended_areas(state: PropalystState) -> PropalystState:
     property_type = state.get("property_type", "")
     budget_max = state.get("budget_max", 100000)
 
-    print(f"   Work: {work_location}")
-    print(f"   Kids: {has_kids}")
-    print(f"   Commute: {commute_time_max} min")
-    print(f"   Type: {property_type}")
-    print(f"   Budget: ₹{budget_max:,}")
+    logger.debug(
+        "Preferences: work=%s, kids=%s, commute=%s min, type=%s, budget=₹%s",
+        work_location, has_kids, commute_time_max, property_type, budget_max
+    )
 
-    # Mock area database
-    # Later: Replace with real API/database query
-    all_areas = [
-        {
-            "areaName": "Whitefield",
-            "image": "https://images.unsplash.com/photo-1600607687939-ce8a6c25118c?q=80&w=2053",
-            "childFriendlyScore": 9,
-            "schoolsNearby": 12,
-            "averageCommute": "15-20 min",
-            "budgetRange": "₹60K - ₹85K",
-            "highlights": ["IT Hub", "Great Schools", "Metro Access"]
-        },
-        {
-            "areaName": "Marathahalli",
-            "image": "https://images.unsplash.com/photo-1600596542815-ffad4c1539a9?q=80&w=2075",
-            "childFriendlyScore": 8,
-            "schoolsNearby": 10,
-            "averageCommute": "20-25 min",
-            "budgetRange": "₹50K - ₹75K",
-            "highlights": ["Good Connectivity", "Family Friendly", "Shopping"]
-        },
-        {
-            "areaName": "Indiranagar",
-            "image": "https://images.unsplash.com/photo-1613490493576-7fde63acd811?q=80&w=2071",
-            "childFriendlyScore": 7,
-            "schoolsNearby": 8,
-            "averageCommute": "25-30 min",
-            "budgetRange": "₹70K - ₹90K",
-            "highlights": ["Upscale Area", "Parks", "Cafes & Restaurants"]
-        },
-        {
-            "areaName": "Brookefield",
-            "image": "https://images.unsplash.com/photo-1600585154340-be6161a56a0c?q=80&w=2070",
-            "childFriendlyScore": 9,
-            "schoolsNearby": 15,
-            "averageCommute": "10-15 min",
-            "budgetRange": "₹55K - ₹80K",
-            "highlights": ["Close to Whitefield", "Quiet", "Premium Schools"]
-        },
-        {
-            "areaName": "Koramangala",
-            "image": "https://images.unsplash.com/photo-1512917774080-9991f1c4c750?q=80&w=2070",
-            "childFriendlyScore": 7,
-            "schoolsNearby": 9,
-            "averageCommute": "30-35 min",
-            "budgetRange": "₹65K - ₹95K",
-            "highlights": ["Vibrant", "Startups", "Nightlife"]
-        },
-        {
-            "areaName": "HSR Layout",
-            "image": "https://images.unsplash.com/photo-1580587771525-78b9dba3b914?q=80&w=2074",
-            "childFriendlyScore": 8,
-            "schoolsNearby": 11,
-            "averageCommute": "25-30 min",
-            "budgetRange": "₹55K - ₹80K",
-            "highlights": ["Parks", "Shopping", "Well-planned"]
-        }
-    ]
-
-    # Simple filtering logic (mock for now)
-    # Later: Implement real scoring/filtering algorithm
-    recommended = all_areas[:6]  # Return all 6 for now
+    recommended = list(find_recommended_areas(
+        work_location, has_kids, commute_time_max, property_type, budget_max
+    ))
 
-    print(f"   ✅ Found {len(recommended)} recommended areas")
+    logger.debug("Found %d recommended areas", len(recommended))
 
     # Return updated state
     return {
-        **state,
         "recommended_areas": recommended,
         "calculated": True,
         "message": f"Based on your preferences, here are {len(recommended)} recommended areas",
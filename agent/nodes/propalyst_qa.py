@@ -18,17 +18,79 @@ Node asks question → Shows UI component → User answers → Parse answer →
 
 import re
 import os
-import json
-from typing import Dict, Any
+import logging
+import orjson
+import operator
+import functools
+import httpx
+from cachetools import TTLCache
+from typing import Dict, Any, List, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 from ..state import PropalystState, UIComponent
 
+logger = logging.getLogger(__name__)
+
+
+# Precompiled patterns for the fallback answer parsers
+_HOUR_RE = re.compile(r'(\d+)\s*h(?:our|r)?')
+_NUM_RE = re.compile(r'(\d+)')
+_LAKH_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:lakh|lac)')
+_K_RE = re.compile(r'(\d+)\s*k')
+_WORD_RE = re.compile(r"[a-z']+")
+
+# Characters removed before numeric parsing ("₹75,000" -> "75000")
+_NUM_STRIP_TABLE = str.maketrans('', '', '₹,')
+
+# Keyword tables for the fallback answer parsers (matched against whole words)
+# parse_kids_answer checks _KIDS_NO first, so "I have no kids" and "No, I don't
+# have kids" read as no ("have" is deliberately not a positive word)
+_KIDS_YES = frozenset({"yes", "yeah", "yep", "yup", "true"})
+_KIDS_NO = frozenset({"no", "nope", "nah", "false", "don't", "dont", "not"})
+# One-word answers resolved without the LLM ("yeah" -> True, "nope" -> False)
+_KIDS_ONE_WORD = {**dict.fromkeys(_KIDS_YES, True), **dict.fromkeys(_KIDS_NO, False)}
+_VILLA_WORDS = frozenset({"villa", "independent", "house"})
+_ROW_HOUSE_WORDS = frozenset({"row", "townhouse"})
+
+# Acknowledgments that already ask about the next topic. The kids check is
+# case-sensitive ("Do you"); the others are searched case-insensitively, so
+# the previous message is never lowercased
+_ASKS_KIDS_RE = re.compile("Do you")
+_ASKS_COMMUTE_RE = re.compile("commute", re.I)
+_ASKS_PROPERTY_RE = re.compile("property", re.I)
+_ASKS_BUDGET_RE = re.compile("budget", re.I)
+
+# Answers clean enough to parse without asking the LLM ("30", "45 min", "1 hour",
+# "80000", "₹75,000", "80k", "1.5 lakh")
+_CLEAN_COMMUTE_RE = re.compile(r'\d+\s*(?:m|mins?|minutes?|h|hrs?|hours?)?')
+_CLEAN_BUDGET_RE = re.compile(r'(?:₹|rs\.?)?\s*\d+(?:\.\d+)?\s*(?:k|lakhs?|lacs?)?')
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client used for OpenAI calls.
+
+    One long-lived client keeps a warm keep-alive pool to api.openai.com,
+    so validation calls skip the TLS handshake, and HTTP/2 lets the
+    parallel bulk validations share a single connection.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        timeout=30.0
+    )
+
 
+@functools.lru_cache(maxsize=1)
 def get_llm():
     """
     Initialize and return the LLM instance (same pattern as ui_extractor.py).
 
+    The instance is created once and reused for every validation call,
+    so the underlying HTTP client and its connection pool are shared.
+    Use get_llm.cache_clear() to pick up changed environment variables.
+
     Uses environment variables:
     - OPENAI_API_KEY: Your OpenAI API key
     - LLM_MODEL: Model name (default: gpt-4o-mini)
@@ -48,7 +110,8 @@ def get_llm():
         api_key=api_key,
         model=model,
         temperature=temperature,
-        model_kwargs={"response_format": {"type": "json_object"}}
+        model_kwargs={"response_format": {"type": "json_object"}},
+        http_async_client=get_http_client()
     )
 
 
@@ -56,30 +119,15 @@ def get_llm():
 # LLM VALIDATION
 # ============================================================================
 
-async def validate_answer_with_llm(field: str, user_input: str, state: PropalystState) -> Dict[str, Any]:
-    """
-    Use LLM to intelligently validate and extract user answers.
-
-    Args:
-        field: Which field is being answered (work_location, has_kids, etc.)
-        user_input: Raw user input
-        state: Current state (for context)
-
-    Returns:
-        {
-            "valid": bool,
-            "extracted_value": Any or None,
-            "message": str (contextual response from LLM)
-        }
-    """
-
-    # Build field-specific validation prompts
-    if field == "work_location":
-        prompt = f"""You are helping a user find rental properties in Bangalore, India.
+# Field-specific validation prompts. Each template has a single {user_input}
+# slot and is filled with .format(); literal JSON braces are doubled.
+# The user's answer always goes on the last line so everything before it is
+# byte-identical across calls (lets OpenAI's automatic prompt caching kick in).
+_VALIDATION_SYSTEM_PROMPT = "You are a helpful assistant validating user input for a property search app. Always respond with valid JSON."
 
-The user said: "{user_input}"
+_WORK_LOCATION_PROMPT = """You are helping a user find rental properties in Bangalore, India.
 
-Is this a valid Bangalore neighborhood/area/location?
+Is the user's answer (given at the end) a valid Bangalore neighborhood/area/location?
 
 Valid examples: Whitefield, Koramangala, Indiranagar, MG Road, HSR Layout, Electronic City, Marathahalli, BTM Layout, Jayanagar, JP Nagar, Malleshwaram, Rajajinagar, Yelahanka, etc.
 
@@ -100,12 +148,12 @@ If VALID:
 If INVALID:
 - Set valid=false
 - Set extracted_value=null
-- Message: Politely say you don't recognize it and give 3-4 example areas they could try."""
-
-    elif field == "has_kids":
-        prompt = f"""Extract a yes/no answer from the user's response.
+- Message: Politely say you don't recognize it and give 3-4 example areas they could try.
 
 User said: "{user_input}"
+Respond in JSON:"""
+
+_KIDS_PROMPT = """Extract a yes/no answer from the user's response.
 
 Determine if they have kids or not.
 
@@ -128,12 +176,12 @@ Message examples:
 - If true: "Perfect! Having kids means we'll prioritize areas with good schools and family-friendly amenities."
 - If false: "Got it! We'll focus on areas that match your lifestyle preferences."
 
-Always set valid=true for this field since any response can be interpreted."""
-
-    elif field == "commute_time_max":
-        prompt = f"""Extract commute time in minutes from user input.
+Always set valid=true for this field since any response can be interpreted.
 
 User said: "{user_input}"
+Respond in JSON:"""
+
+_COMMUTE_PROMPT = """Extract commute time in minutes from user input.
 
 Convert to minutes (integer).
 
@@ -154,12 +202,12 @@ Respond in JSON:
 If you can extract a reasonable time (5-120 minutes): valid=true
 If unclear or unreasonable: valid=false, ask for clarification
 
-Message should acknowledge the commute preference naturally."""
-
-    elif field == "property_type":
-        prompt = f"""Determine property type from user input.
+Message should acknowledge the commute preference naturally.
 
 User said: "{user_input}"
+Respond in JSON:"""
+
+_PROPERTY_TYPE_PROMPT = """Determine property type from user input.
 
 Map to one of: "Villa", "Apartment", "Row House"
 
@@ -178,12 +226,12 @@ Respond in JSON:
 If you can map it: valid=true
 If unclear: valid=false, ask user to choose from the 3 types
 
-Message should acknowledge their choice with a brief positive comment."""
-
-    elif field == "budget_max":
-        prompt = f"""Extract monthly rental budget in rupees from user input.
+Message should acknowledge their choice with a brief positive comment.
 
 User said: "{user_input}"
+Respond in JSON:"""
+
+_BUDGET_PROMPT = """Extract monthly rental budget in rupees from user input.
 
 Convert to integer (rupees).
 
@@ -204,9 +252,164 @@ Respond in JSON:
 If you can extract a reasonable budget (10000-500000): valid=true
 If unclear: valid=false, ask for clarification
 
-Message should acknowledge the budget naturally."""
+Message should acknowledge the budget naturally.
 
-    else:
+User said: "{user_input}"
+Respond in JSON:"""
+
+# One-shot form fill: every field the user volunteered in a free-text message
+_MULTI_FIELD_PROMPT = """You are helping a user find rental properties in Bangalore, India.
+
+Extract every preference the user mentioned in their message. Leave anything they did not mention as null.
+
+Fields:
+- work_location: Bangalore neighborhood/area where they work, proper case (e.g., "Whitefield"), or null
+- has_kids: true or false, or null
+- commute_time_max: maximum commute in minutes (integer, 5-120), or null
+- property_type: "Villa", "Apartment" or "Row House", or null
+- budget_max: maximum monthly rent in rupees (integer, e.g. "80k" → 80000, "1.5 lakh" → 150000), or null
+
+Respond in JSON:
+{{
+    "work_location": ...,
+    "has_kids": ...,
+    "commute_time_max": ...,
+    "property_type": ...,
+    "budget_max": ...
+}}
+
+User said: "{user_input}"
+Respond in JSON:"""
+
+# LLM validation results keyed on (field, normalized input); 1 hour TTL bounds staleness
+_VALIDATION_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+
+# field -> (system prompt, prompt template)
+_PROMPTS = {
+    "work_location": (_VALIDATION_SYSTEM_PROMPT, _WORK_LOCATION_PROMPT),
+    "has_kids": (_VALIDATION_SYSTEM_PROMPT, _KIDS_PROMPT),
+    "commute_time_max": (_VALIDATION_SYSTEM_PROMPT, _COMMUTE_PROMPT),
+    "property_type": (_VALIDATION_SYSTEM_PROMPT, _PROPERTY_TYPE_PROMPT),
+    "budget_max": (_VALIDATION_SYSTEM_PROMPT, _BUDGET_PROMPT),
+}
+
+
+# Precomputed acknowledgments for the has_kids fast path
+_KIDS_MSG = {
+    True: "Perfect! Having kids means we'll prioritize areas with good schools and family-friendly amenities.",
+    False: "Got it! We'll focus on areas that match your lifestyle preferences.",
+}
+
+
+# Button options shown by ask_kids / ask_commute / ask_property_type
+_KIDS_OPTIONS = {"Yes": True, "No": False}
+_COMMUTE_OPTIONS = {"15 min": 15, "30 min": 30, "45 min": 45, "60 min": 60}
+_PROPERTY_TYPE_OPTIONS = ("Villa", "Apartment", "Row House")
+
+# Pre-built validations for every button label, keyed on (field, casefolded
+# input). A button click is resolved with one dict lookup: no parser, no LLM.
+_PRESET_ANSWERS = {
+    **{
+        ("has_kids", label.casefold()): {
+            "valid": True,
+            "extracted_value": has_kids,
+            "message": _KIDS_MSG[has_kids]
+        }
+        for label, has_kids in _KIDS_OPTIONS.items()
+    },
+    **{
+        ("commute_time_max", label.casefold()): {
+            "valid": True,
+            "extracted_value": minutes,
+            "message": f"Got it! We'll look for areas within {minutes} minutes of your workplace."
+        }
+        for label, minutes in _COMMUTE_OPTIONS.items()
+    },
+    **{
+        ("property_type", option.casefold()): {
+            "valid": True,
+            "extracted_value": option,
+            "message": f"Great choice! We'll focus on {option.lower()} listings."
+        }
+        for option in _PROPERTY_TYPE_OPTIONS
+    },
+}
+
+
+def validate_answer_fast(field: str, user_input: str) -> Optional[Dict[str, Any]]:
+    """
+    Validate an answer without the LLM when a simple parser is enough.
+
+    - has_kids: answered locally only when the whole answer is a single
+      yes/no word ("yeah", "nope"); sentences go to the LLM
+    - commute_time_max / budget_max: answered by the regex parsers when the
+      input is a clean number ("30 min", "1 hour", "80k", "1.5 lakh") within
+      the same ranges the LLM prompts use
+    - button clicks (Yes/No, "30 min", "Villa", ...): looked up in _PRESET_ANSWERS
+
+    Args:
+        field: Which field is being answered
+        user_input: Raw user input
+
+    Returns:
+        Same shape as validate_answer_with_llm, or None if the LLM is needed
+    """
+    preset = _PRESET_ANSWERS.get((field, user_input.strip().casefold()))
+    if preset is not None:
+        return preset
+
+    if field == "has_kids":
+        tokens = _WORD_RE.findall(user_input.lower())
+        has_kids = _KIDS_ONE_WORD.get(tokens[0]) if len(tokens) == 1 else None
+        if has_kids is None:
+            return None
+        return {"valid": True, "extracted_value": has_kids, "message": _KIDS_MSG[has_kids]}
+
+    normalized = _norm(user_input)
+
+    if field == "commute_time_max" and _CLEAN_COMMUTE_RE.fullmatch(normalized):
+        minutes = parse_commute_time(normalized)
+        if 5 <= minutes <= 120:
+            return {
+                "valid": True,
+                "extracted_value": minutes,
+                "message": f"Got it! We'll look for areas within {minutes} minutes of your workplace."
+            }
+
+    elif field == "budget_max" and _CLEAN_BUDGET_RE.fullmatch(normalized):
+        budget = parse_budget(normalized)
+        if 10000 <= budget <= 500000:
+            return {
+                "valid": True,
+                "extracted_value": budget,
+                "message": f"Great! We'll look for homes within ₹{budget:,} a month."
+            }
+
+    return None
+
+
+def _validation_fallback(user_input: str) -> Dict[str, Any]:
+    """Result used when the LLM call fails: accept the input as-is."""
+    return {
+        "valid": True,
+        "extracted_value": user_input,
+        "message": "Thank you! Let's continue."
+    }
+
+
+def _validation_without_llm(field: str, user_input: str) -> Optional[Dict[str, Any]]:
+    """
+    Answer a validation from the fast parsers or the cache, if possible.
+
+    Returns:
+        The validation result, or None if the LLM has to be asked
+    """
+    # Fast path: answers we can parse deterministically skip the LLM roundtrip
+    fast_result = validate_answer_fast(field, user_input)
+    if fast_result is not None:
+        return fast_result
+
+    if field not in _PROMPTS:
         # Fallback for unknown field
         return {
             "valid": False,
@@ -214,35 +417,66 @@ Message should acknowledge the budget naturally."""
             "message": f"Unknown field: {field}"
         }
 
-    try:
-        # Get LLM instance
-        llm = get_llm()
+    # Same answer to the same question (retries, double-clicks, resumed sessions)?
+    return _VALIDATION_CACHE.get((field, user_input.strip().lower()))
 
-        # Create LangChain messages
-        messages = [
-            SystemMessage(content="You are a helpful assistant validating user input for a property search app. Always respond with valid JSON."),
-            HumanMessage(content=prompt)
-        ]
 
-        # Call LLM using LangChain (async)
-        response = await llm.ainvoke(messages)
-        result = json.loads(response.content)
+def _validation_messages(field: str, user_input: str) -> List[Any]:
+    """Build the LangChain messages for an LLM validation of one answer."""
+    system_prompt, template = _PROMPTS[field]
+    return [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=template.format(user_input=user_input))
+    ]
+
+
+def _parse_validation(field: str, user_input: str, content: str) -> Dict[str, Any]:
+    """Parse the LLM's JSON reply and cache it (only real answers are cached)."""
+    result = orjson.loads(content)
+    _VALIDATION_CACHE[(field, user_input.strip().lower())] = result
+    return result
+
+
+async def validate_answer_with_llm(field: str, user_input: str, state: PropalystState) -> Dict[str, Any]:
+    """
+    Use LLM to intelligently validate and extract user answers.
+
+    Args:
+        field: Which field is being answered (work_location, has_kids, etc.)
+        user_input: Raw user input
+        state: Current state (for context)
+
+    Returns:
+        {
+            "valid": bool,
+            "extracted_value": Any or None,
+            "message": str (contextual response from LLM)
+        }
+    """
+
+    result = _validation_without_llm(field, user_input)
+    if result is not None:
         return result
 
+    try:
+        # Call LLM using LangChain (async)
+        response = await get_llm().ainvoke(_validation_messages(field, user_input))
+        return _parse_validation(field, user_input, response.content)
+
     except Exception as e:
-        print(f"   ⚠️  LLM validation error: {e}")
-        # Fallback to accepting the input
-        return {
-            "valid": True,
-            "extracted_value": user_input,
-            "message": "Thank you! Let's continue."
-        }
+        logger.warning("LLM validation error: %s", e)
+        return _validation_fallback(user_input)
 
 
 # ============================================================================
 # ANSWER PARSING HELPERS (Legacy - kept as fallback)
 # ============================================================================
 
+def _norm(user_input: str) -> str:
+    """Normalize input for numeric parsing in a single translate pass."""
+    return user_input.translate(_NUM_STRIP_TABLE).lower().strip()
+
+
 def parse_work_location(user_input: str) -> str:
     """
     Parse work location from user input.
@@ -282,17 +516,23 @@ def parse_kids_answer(user_input: str) -> bool:
         False
         >>> parse_kids_answer("Yeah I do")
         True
+        >>> parse_kids_answer("No, I don't have kids")
+        False
+        >>> parse_kids_answer("I have no kids")
+        False
+        >>> parse_kids_answer("Don't have any")
+        False
     """
-    normalized = user_input.lower().strip()
+    tokens = set(_WORD_RE.findall(user_input.lower()))
+
+    # Negative indicators (checked first, see _KIDS_NO)
+    if tokens & _KIDS_NO:
+        return False
 
     # Positive indicators
-    if any(word in normalized for word in ["yes", "yeah", "yep", "yup", "true", "have"]):
+    if tokens & _KIDS_YES:
         return True
 
-    # Negative indicators
-    if any(word in normalized for word in ["no", "nope", "nah", "false", "don't", "do not"]):
-        return False
-
     # Default: assume no
     return False
 
@@ -320,16 +560,22 @@ def parse_commute_time(user_input: str) -> int:
         >>> parse_commute_time("45")
         45
     """
-    normalized = user_input.lower().strip()
+    normalized = _norm(user_input)
+
+    # Fast path: plain number ("30") needs no regex
+    try:
+        return int(normalized)
+    except ValueError:
+        pass
 
     # Check for hours
-    hour_match = re.search(r'(\d+)\s*h(?:our|r)?', normalized)
+    hour_match = _HOUR_RE.search(normalized)
     if hour_match:
         hours = int(hour_match.group(1))
         return hours * 60
 
     # Extract first number
-    number_match = re.search(r'(\d+)', normalized)
+    number_match = _NUM_RE.search(normalized)
     if number_match:
         return int(number_match.group(1))
 
@@ -360,12 +606,12 @@ def parse_property_type(user_input: str) -> str:
         >>> parse_property_type("independent house")
         "Villa"
     """
-    normalized = user_input.lower().strip()
+    tokens = set(_WORD_RE.findall(user_input.lower()))
 
     # Map variations
-    if any(word in normalized for word in ["villa", "independent", "house"]):
+    if tokens & _VILLA_WORDS:
         return "Villa"
-    elif any(word in normalized for word in ["row", "townhouse"]):
+    elif tokens & _ROW_HOUSE_WORDS:
         return "Row House"
     else:
         return "Apartment"  # Default
@@ -395,25 +641,30 @@ def parse_budget(user_input: str) -> int:
         >>> parse_budget("1.5 lakh")
         150000
     """
-    normalized = user_input.lower().strip()
+    # One pass: drop ₹ and thousands separators, lowercase, trim.
+    # ("rs" prefixes need no stripping: the patterns below only search for numbers)
+    normalized = _norm(user_input)
 
-    # Remove currency symbols
-    normalized = normalized.replace('₹', '').replace('rs', '').strip()
+    # Fast path: plain number ("80000") needs no regex
+    try:
+        return int(normalized)
+    except ValueError:
+        pass
 
     # Handle "lakh" (1 lakh = 100,000)
-    lakh_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:lakh|lac)', normalized)
+    lakh_match = _LAKH_RE.search(normalized)
     if lakh_match:
         lakhs = float(lakh_match.group(1))
         return int(lakhs * 100000)
 
     # Handle "k" (thousand)
-    k_match = re.search(r'(\d+)\s*k', normalized)
+    k_match = _K_RE.search(normalized)
     if k_match:
         thousands = int(k_match.group(1))
         return thousands * 1000
 
     # Extract plain number
-    number_match = re.search(r'(\d+)', normalized)
+    number_match = _NUM_RE.search(normalized)
     if number_match:
         return int(number_match.group(1))
 
@@ -425,7 +676,119 @@ def parse_budget(user_input: str) -> int:
 # Q&A NODES
 # ============================================================================
 
-async def ask_work_location(state: PropalystState) -> PropalystState:
+# The ButtonGroup/Slider components never change, so each is built (and
+# validated by Pydantic) once and shared by every session. Never mutate them.
+_KIDS_COMPONENT = UIComponent(
+    type="ButtonGroup",
+    props={
+        "field": "has_kids",
+        "options": list(_KIDS_OPTIONS)
+    }
+)
+
+_COMMUTE_COMPONENT = UIComponent(
+    type="ButtonGroup",
+    props={
+        "field": "commute_time_max",
+        "options": list(_COMMUTE_OPTIONS)
+    }
+)
+
+_PROPERTY_TYPE_COMPONENT = UIComponent(
+    type="ButtonGroup",
+    props={
+        "field": "property_type",
+        "options": list(_PROPERTY_TYPE_OPTIONS)
+    }
+)
+
+_BUDGET_COMPONENT = UIComponent(
+    type="Slider",
+    props={
+        "field": "budget_max",
+        "min": 20000,
+        "max": 150000,
+        "step": 5000,
+        "defaultValue": 75000,
+        "label": "What's your monthly budget?",
+        "format": "₹{value}"
+    }
+)
+
+
+# Their JSON never changes either: serialized once, spliced into replies as-is
+# The fields the frontend renders. UIComponent allows extra fields (see
+# agent/state.py); those stay server-side and are never serialized here.
+_COMPONENT_KEYS = frozenset({"type", "props"})
+
+_STATIC_COMPONENT_JSON = {
+    id(component): component.model_dump_json(include=_COMPONENT_KEYS).encode()
+    for component in (_KIDS_COMPONENT, _COMMUTE_COMPONENT, _PROPERTY_TYPE_COMPONENT, _BUDGET_COMPONENT)
+}
+
+
+def component_json(component: UIComponent) -> bytes:
+    """
+    JSON bytes for a UI component, e.g. b'{"type":"Slider","props":{...}}'.
+
+    The shared ask_* components come from _STATIC_COMPONENT_JSON, so the
+    Pydantic dump only runs for components built per request, and runs
+    in pydantic-core (restricted to _COMPONENT_KEYS).
+    """
+    cached = _STATIC_COMPONENT_JSON.get(id(component))
+    if cached is not None:
+        return cached
+    return component.model_dump_json(include=_COMPONENT_KEYS).encode()
+
+
+def _build_ask_response(
+    state: PropalystState,
+    question: str,
+    forbidden: re.Pattern,
+    component: UIComponent,
+    step: int
+) -> Dict[str, Any]:
+    """
+    Shared tail of the ask_* nodes: build the reply and record the question.
+
+    If there's a previous LLM acknowledgment, send both separated by "|||"
+    (acknowledgment ||| question). The acknowledgment is skipped when it is
+    too short or already matches `forbidden`, i.e. it already asks about
+    this topic.
+
+    Args:
+        state: Current state
+        question: The question to ask
+        forbidden: Case-insensitive pattern meaning prev message already covers it
+        component: UI component to show for this question
+        step: Question number (1-5)
+
+    Returns:
+        State update (only the changed keys): component, message,
+        messages and current_step; LangGraph merges it into the state
+    """
+    prev_message = state.get("message", "")
+
+    if prev_message and len(prev_message) > 10 and not forbidden.search(prev_message):
+        # Combine: acknowledgment ||| question
+        combined_message = f"{prev_message}|||{question}"
+        logger.debug("Sending both: acknowledgment + question")
+    else:
+        combined_message = question
+        logger.debug("Message: %s", question)
+
+    # Append question message to conversation history
+    messages = [*(state.get("messages") or []), {"role": "agent", "content": question}]
+
+    return {
+        "component": component,
+        "message": combined_message,
+        "messages": messages,
+        "current_step": step
+    }
+
+
+async def ask_work_location(state: PropalystState) -> Dict[str, Any]:
     """
     Q1: Ask where user works.
 
@@ -435,10 +798,10 @@ async def ask_work_location(state: PropalystState) -> PropalystState:
 
     # Already answered? Skip
     if state.get("work_location"):
-        print(f"   ✅ Already have work_location: {state['work_location']}")
-        return state
+        logger.debug("Already have work_location: %s", state["work_location"])
+        return {}
 
-    print("   📍 Asking for work location (chat box only)...")
+    logger.debug("Asking for work location (chat box only)")
 
     # Check if there's an error message from validation (invalid input)
     existing_message = state.get("message", "")
@@ -447,21 +810,20 @@ async def ask_work_location(state: PropalystState) -> PropalystState:
     # If there's an error message from LLM validation, preserve it!
     if error and existing_message and len(existing_message) > 20:
         message = existing_message
-        print(f"   💬 Using LLM error message: {message}")
+        logger.debug("Using LLM error message: %s", message)
     else:
         # No error, use initial greeting
         message = "Hi! Let me help you find your perfect home. Where do you work?"
-        print(f"   📝 Using initial message")
+        logger.debug("Using initial message")
 
     return {
-        **state,
         "component": None,  # No UI component - use chat box
         "message": message,
         "current_step": 1
     }
 
 
-async def ask_kids(state: PropalystState) -> PropalystState:
+async def ask_kids(state: PropalystState) -> Dict[str, Any]:
     """
     Q2: Ask if user has kids.
 
@@ -470,46 +832,24 @@ async def ask_kids(state: PropalystState) -> PropalystState:
 
     # Already answered? Skip
     if state.get("has_kids") is not None:
-        print(f"   ✅ Already have has_kids: {state['has_kids']}")
-        return state
+        logger.debug("Already have has_kids: %s", state["has_kids"])
+        return {}
 
-    print("   👶 Asking about kids...")
+    logger.debug("Asking about kids")
 
     # The question to ask
     question = "Do you have kids?"
 
-    # Check if there's a previous LLM acknowledgment message
-    prev_message = state.get("message", "")
-
-    # If there's a previous message (LLM acknowledgment), send both separated by "|||"
-    if prev_message and len(prev_message) > 10 and "Do you" not in prev_message:
-        # Combine: acknowledgment ||| question
-        combined_message = f"{prev_message}|||{question}"
-        print(f"   💬 Sending both: acknowledgment + question")
-    else:
-        combined_message = question
-        print(f"   📝 Message: {question}")
-
-    # Append question message to conversation history
-    messages = state.get("messages", [])
-    messages = messages + [{"role": "agent", "content": question}]
-
-    return {
-        **state,
-        "component": UIComponent(
-            type="ButtonGroup",
-            props={
-                "field": "has_kids",
-                "options": ["Yes", "No"]
-            }
-        ),
-        "message": combined_message,
-        "messages": messages,
-        "current_step": 2
-    }
+    return _build_ask_response(
+        state,
+        question,
+        _ASKS_KIDS_RE,
+        _KIDS_COMPONENT,
+        step=2
+    )
 
 
-async def ask_commute(state: PropalystState) -> PropalystState:
+async def ask_commute(state: PropalystState) -> Dict[str, Any]:
     """
     Q3: Ask about ideal commute time.
 
@@ -519,47 +859,25 @@ async def ask_commute(state: PropalystState) -> PropalystState:
 
     # Already answered? Skip
     if state.get("commute_time_max"):
-        print(f"   ✅ Already have commute_time_max: {state['commute_time_max']}")
-        return state
+        logger.debug("Already have commute_time_max: %s", state["commute_time_max"])
+        return {}
 
-    print("   🚗 Asking about commute time...")
+    logger.debug("Asking about commute time")
 
     # The question to ask
     work_location = state.get("work_location", "work")
     question = f"What's your ideal commute time to {work_location}?"
 
-    # Check if there's a previous LLM acknowledgment message
-    prev_message = state.get("message", "")
-
-    # If there's a previous message (LLM acknowledgment), send both separated by "|||"
-    if prev_message and len(prev_message) > 10 and "commute" not in prev_message.lower():
-        # Combine: acknowledgment ||| question
-        combined_message = f"{prev_message}|||{question}"
-        print(f"   💬 Sending both: acknowledgment + question")
-    else:
-        combined_message = question
-        print(f"   📝 Message: {question}")
-
-    # Append question message to conversation history
-    messages = state.get("messages", [])
-    messages = messages + [{"role": "agent", "content": question}]
-
-    return {
-        **state,
-        "component": UIComponent(
-            type="ButtonGroup",
-            props={
-                "field": "commute_time_max",
-                "options": ["15 min", "30 min", "45 min", "60 min"]
-            }
-        ),
-        "message": combined_message,
-        "messages": messages,
-        "current_step": 3
-    }
+    return _build_ask_response(
+        state,
+        question,
+        _ASKS_COMMUTE_RE,
+        _COMMUTE_COMPONENT,
+        step=3
+    )
 
 
-async def ask_property_type(state: PropalystState) -> PropalystState:
+async def ask_property_type(state: PropalystState) -> Dict[str, Any]:
     """
     Q4: Ask about property type preference.
 
@@ -568,46 +886,24 @@ async def ask_property_type(state: PropalystState) -> PropalystState:
 
     # Already answered? Skip
     if state.get("property_type"):
-        print(f"   ✅ Already have property_type: {state['property_type']}")
-        return state
+        logger.debug("Already have property_type: %s", state["property_type"])
+        return {}
 
-    print("   🏠 Asking about property type...")
+    logger.debug("Asking about property type")
 
     # The question to ask
     question = "What type of property are you looking for?"
 
-    # Check if there's a previous LLM acknowledgment message
-    prev_message = state.get("message", "")
-
-    # If there's a previous message (LLM acknowledgment), send both separated by "|||"
-    if prev_message and len(prev_message) > 10 and "property" not in prev_message.lower():
-        # Combine: acknowledgment ||| question
-        combined_message = f"{prev_message}|||{question}"
-        print(f"   💬 Sending both: acknowledgment + question")
-    else:
-        combined_message = question
-        print(f"   📝 Message: {question}")
-
-    # Append question message to conversation history
-    messages = state.get("messages", [])
-    messages = messages + [{"role": "agent", "content": question}]
-
-    return {
-        **state,
-        "component": UIComponent(
-            type="ButtonGroup",
-            props={
-                "field": "property_type",
-                "options": ["Villa", "Apartment", "Row House"]
-            }
-        ),
-        "message": combined_message,
-        "messages": messages,
-        "current_step": 4
-    }
+    return _build_ask_response(
+        state,
+        question,
+        _ASKS_PROPERTY_RE,
+        _PROPERTY_TYPE_COMPONENT,
+        step=4
+    )
 
 
-async def ask_budget(state: PropalystState) -> PropalystState:
+async def ask_budget(state: PropalystState) -> Dict[str, Any]:
     """
     Q5: Ask about monthly budget.
 
@@ -616,48 +912,65 @@ async def ask_budget(state: PropalystState) -> PropalystState:
 
     # Already answered? Skip
     if state.get("budget_max"):
-        print(f"   ✅ Already have budget_max: {state['budget_max']}")
-        return state
+        logger.debug("Already have budget_max: %s", state["budget_max"])
+        return {}
 
-    print("   💰 Asking about budget...")
+    logger.debug("Asking about budget")
 
     # The question to ask
     question = "What's your monthly rental budget?"
 
-    # Check if there's a previous LLM acknowledgment message
-    prev_message = state.get("message", "")
+    return _build_ask_response(
+        state,
+        question,
+        _ASKS_BUDGET_RE,
+        _BUDGET_COMPONENT,
+        step=5
+    )
 
-    # If there's a previous message (LLM acknowledgment), send both separated by "|||"
-    if prev_message and len(prev_message) > 10 and "budget" not in prev_message.lower():
-        # Combine: acknowledgment ||| question
-        combined_message = f"{prev_message}|||{question}"
-        print(f"   💬 Sending both: acknowledgment + question")
-    else:
-        combined_message = question
-        print(f"   📝 Message: {question}")
 
-    # Append question message to conversation history
-    messages = state.get("messages", [])
-    messages = messages + [{"role": "agent", "content": question}]
+# Question order: (state field, "is it missing?" predicate, node that asks it).
+# has_kids is a bool, so only None counts as missing; other fields are missing when empty.
+_QUESTIONS = (
+    ("work_location", operator.not_, ask_work_location),
+    ("has_kids", functools.partial(operator.is_, None), ask_kids),
+    ("commute_time_max", operator.not_, ask_commute),
+    ("property_type", operator.not_, ask_property_type),
+    ("budget_max", operator.not_, ask_budget),
+)
 
-    return {
-        **state,
-        "component": UIComponent(
-            type="Slider",
-            props={
-                "field": "budget_max",
-                "min": 20000,
-                "max": 150000,
-                "step": 5000,
-                "defaultValue": 75000,
-                "label": "What's your monthly budget?",
-                "format": "₹{value}"
-            }
-        ),
-        "message": combined_message,
-        "messages": messages,
-        "current_step": 5
-    }
+# Fields a user answer may set
+_VALID_FIELDS = frozenset(question[0] for question in _QUESTIONS)
+
+
+def _next_question(state: PropalystState):
+    """Return the first unanswered (field, is_missing, ask) entry, or None."""
+    get = state.get
+    for question in _QUESTIONS:
+        if question[1](get(question[0])):
+            return question
+    return None
+
+
+def next_unanswered_field(state: PropalystState) -> Optional[str]:
+    """
+    Return the first question field that still needs an answer, or None.
+    """
+    question = _next_question(state)
+    return question[0] if question else None
+
+
+async def ask_next(state: PropalystState) -> Dict[str, Any]:
+    """
+    Ask the next unanswered question (Q1-Q5).
+
+    Single graph node that dispatches to the matching ask_* function,
+    so the graph needs one node instead of five.
+    """
+    question = _next_question(state)
+    if question is None:
+        return {}
+    return await question[2](state)
 
 
 # ============================================================================
@@ -692,17 +1005,14 @@ async def process_user_answer(state: PropalystState, field: str, user_input: str
         >>> state["message"]  # "I don't recognize 'ABCD'..."
     """
 
-    print(f"   🔄 Processing answer for field: {field}")
-    print(f"   📝 User input: {user_input}")
+    logger.debug("Processing answer for field %s: %s", field, user_input)
 
     # ✨ NEW: Validate with LLM first
-    print(f"   🤖 Validating with LLM...")
     validation = await validate_answer_with_llm(field, user_input, state)
 
     if not validation["valid"]:
         # ❌ Invalid answer - don't update state, return error message
-        print(f"   ❌ Invalid answer!")
-        print(f"   💬 LLM message: {validation['message']}")
+        logger.debug("Invalid answer, LLM message: %s", validation["message"])
 
         return {
             **state,
@@ -714,26 +1024,15 @@ async def process_user_answer(state: PropalystState, field: str, user_input: str
     value = validation["extracted_value"]
     llm_message = validation["message"]
 
-    print(f"   ✅ Valid! Extracted value: {value}")
-    print(f"   💬 LLM message: {llm_message}")
+    logger.debug("Valid! Extracted value: %s, LLM message: %s", value, llm_message)
 
     # Update state based on field
-    if field == "work_location":
-        state["work_location"] = value
-    elif field == "has_kids":
-        state["has_kids"] = value
-    elif field == "commute_time_max":
-        state["commute_time_max"] = value
-    elif field == "property_type":
-        state["property_type"] = value
-    elif field == "budget_max":
-        state["budget_max"] = value
-    else:
-        print(f"   ⚠️  Unknown field: {field}")
+    if field not in _VALID_FIELDS:
+        logger.warning("Unknown field: %s", field)
         return state
 
     # Add to message history
-    messages = list(state.get("messages", []))
+    messages = list(state.get("messages") or [])
     # Add user's answer
     messages.append({"role": "user", "content": user_input})
     # Add LLM acknowledgment
@@ -742,12 +1041,212 @@ async def process_user_answer(state: PropalystState, field: str, user_input: str
     # Use LLM-generated contextual message
     return {
         **state,
+        field: value,
         "messages": messages,
         "message": llm_message,
         "error": None  # Clear any previous errors
     }
 
 
+async def process_user_answers(state: PropalystState, answers: Dict[str, str]) -> PropalystState:
+    """
+    Process several answers in one go (bulk fill, e.g. a re-hydrated session).
+
+    Answers the fast parsers or the cache can settle skip the LLM; the rest
+    are sent together in one llm.abatch() call, so N answers cost one LLM
+    round-trip of wall-clock time instead of N.
+
+    Valid answers are saved; invalid ones are left unanswered so the router
+    asks for them again, and the first invalid answer's LLM message is shown.
+
+    Args:
+        state: Current state
+        answers: Mapping of field name → raw user input
+
+    Returns:
+        Updated state with all valid answers applied
+
+    Example:
+        >>> state = await process_user_answers(state, {
+        ...     "work_location": "Whitefield",
+        ...     "has_kids": "Yes"
+        ... })
+        >>> state["work_location"], state["has_kids"]
+        ("Whitefield", True)
+    """
+
+    fields = [field for field, user_input in answers.items() if user_input]
+    logger.debug("Processing %d answers in parallel: %s", len(fields), fields)
+
+    # Fast-path and cached answers first; whatever is left goes to the LLM
+    # in a single abatch() call
+    validations = [_validation_without_llm(field, answers[field]) for field in fields]
+    pending = [i for i, validation in enumerate(validations) if validation is None]
+
+    if pending:
+        logger.debug("Validating %d answers with one LLM batch", len(pending))
+        try:
+            responses = await get_llm().abatch(
+                [_validation_messages(fields[i], answers[fields[i]]) for i in pending],
+                return_exceptions=True
+            )
+        except Exception as e:
+            responses = [e] * len(pending)
+
+        for i, response in zip(pending, responses):
+            field, user_input = fields[i], answers[fields[i]]
+            try:
+                if isinstance(response, Exception):
+                    raise response
+                validations[i] = _parse_validation(field, user_input, response.content)
+            except Exception as e:
+                logger.warning("LLM validation error: %s", e)
+                validations[i] = _validation_fallback(user_input)
+
+    messages = list(state.get("messages") or [])
+    updates = {}
+    acknowledgments = []
+    error_messages = []
+
+    for field, validation in zip(fields, validations):
+        if not validation["valid"]:
+            logger.debug("Invalid answer for %s", field)
+            error_messages.append(validation["message"])
+            continue
+
+        updates[field] = validation["extracted_value"]
+        acknowledgments.append(validation["message"])
+        messages.append({"role": "user", "content": answers[field]})
+        messages.append({"role": "agent", "content": validation["message"]})
+
+    if error_messages:
+        return {
+            **state,
+            **updates,
+            "messages": messages,
+            "message": error_messages[0],
+            "error": "Invalid input - please try again"
+        }
+
+    return {
+        **state,
+        **updates,
+        "messages": messages,
+        "message": " ".join(acknowledgments),
+        "error": None
+    }
+
+
+# Human-readable names for the acknowledgment in extract_multi_field
+_FIELD_LABELS = {
+    "work_location": "work location",
+    "has_kids": "family details",
+    "commute_time_max": "commute limit",
+    "property_type": "property type",
+    "budget_max": "budget",
+}
+
+
+def _check_multi_field(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Keep only the extracted values that pass the per-field sanity checks.
+
+    work_location only has to be a non-empty string here; whether it is a
+    Bangalore area is checked afterwards by validate_answer_with_llm, as
+    for a single answer (see extract_multi_field).
+    """
+    checked = {}
+
+    work_location = data.get("work_location")
+    if isinstance(work_location, str) and work_location.strip():
+        checked["work_location"] = work_location.strip()
+
+    has_kids = data.get("has_kids")
+    if isinstance(has_kids, bool):
+        checked["has_kids"] = has_kids
+
+    commute = data.get("commute_time_max")
+    if isinstance(commute, int) and not isinstance(commute, bool) and 5 <= commute <= 120:
+        checked["commute_time_max"] = commute
+
+    property_type = data.get("property_type")
+    if property_type in _PROPERTY_TYPE_OPTIONS:
+        checked["property_type"] = property_type
+
+    budget = data.get("budget_max")
+    if isinstance(budget, int) and not isinstance(budget, bool) and 10000 <= budget <= 500000:
+        checked["budget_max"] = budget
+
+    return checked
+
+
+async def extract_multi_field(state: PropalystState, user_input: str) -> PropalystState:
+    """
+    Fill every answer the user volunteered in one free-text message.
+
+    One LLM call returns a partial {work_location, has_kids, commute_time_max,
+    property_type, budget_max} dict (e.g. "I work in Whitefield, have kids,
+    want an apartment under 80k" fills four fields at once). Values are
+    sanity-checked with the same rules as the per-field prompts (the work
+    location goes through validate_answer_with_llm, so unknown areas are
+    dropped) and merged into state; the graph then asks the first
+    still-unanswered question.
+
+    If nothing usable comes back, falls back to validating the input as the
+    answer to the next unanswered question (process_user_answer).
+
+    Args:
+        state: Current state
+        user_input: Raw free-text user message
+
+    Returns:
+        Updated state
+    """
+    logger.debug("Extracting all fields from: %s", user_input)
+
+    try:
+        response = await get_llm().ainvoke([
+            SystemMessage(content=_VALIDATION_SYSTEM_PROMPT),
+            HumanMessage(content=_MULTI_FIELD_PROMPT.format(user_input=user_input))
+        ])
+        extracted = _check_multi_field(orjson.loads(response.content))
+    except Exception as e:
+        logger.warning("Multi-field extraction error: %s", e)
+        extracted = {}
+
+    # Same Bangalore-area check as a single work_location answer
+    if "work_location" in extracted:
+        validation = await validate_answer_with_llm("work_location", extracted["work_location"], state)
+        if validation["valid"]:
+            extracted["work_location"] = validation["extracted_value"]
+        else:
+            del extracted["work_location"]
+
+    if not extracted:
+        field = next_unanswered_field(state)
+        if field is None:
+            return state
+        return await process_user_answer(state, field, user_input)
+
+    logger.debug("Extracted fields: %s", extracted)
+
+    llm_message = "Got it! I noted your " + ", ".join(
+        _FIELD_LABELS[field] for field in extracted
+    ) + "."
+
+    messages = list(state.get("messages") or [])
+    messages.append({"role": "user", "content": user_input})
+    messages.append({"role": "agent", "content": llm_message})
+
+    return {
+        **state,
+        **extracted,
+        "messages": messages,
+        "message": llm_message,
+        "error": None
+    }
+
+
 # ============================================================================
 # EXPORT
 # ============================================================================
@@ -758,5 +1257,10 @@ __all__ = [
     "ask_commute",
     "ask_property_type",
     "ask_budget",
-    "process_user_answer"
+    "ask_next",
+    "next_unanswered_field",
+    "process_user_answer",
+    "process_user_answers",
+    "extract_multi_field",
+    "component_json"
 ]
@@ -29,31 +29,55 @@ Output state: {
               }
 """
 
-import json
+import re
 import os
-from typing import Dict, Any
+import logging
+import orjson
+import asyncio
+import functools
+import httpx
+import openai
+from cachetools import LRUCache
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Any, List, Optional
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
-from ..state import AgentState, UIComponent, get_component_schemas_text
+from ..batching import LLMBatcher
+from .propalyst_qa import get_http_client
+from ..state import AgentState, UIComponent, create_initial_state, get_component_schemas_text
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
 # LLM SETUP
 # ============================================================================
 
-def get_llm():
+@dataclass(frozen=True, slots=True)
+class LLMConfig:
+    """LLM settings for the UI extractor (see get_llm_config)."""
+    api_key: str
+    model: str
+    temperature: float
+
+
+@functools.lru_cache(maxsize=1)
+def get_llm_config() -> LLMConfig:
     """
-    Initialize and return the LLM instance.
+    Read the LLM settings from the environment once.
+
+    Read on first use rather than at import: .env is loaded by
+    app_factory.create_app(), and this module may be imported before that
+    runs (tools, tests), so an import-time read could miss it.
+    Use get_llm_config.cache_clear() to pick up changed environment variables.
 
     Uses environment variables:
     - OPENAI_API_KEY: Your OpenAI API key
-    - LLM_MODEL: Model name (default: gpt-3.5-turbo)
+    - LLM_MODEL: Model name (default: gpt-5-nano-2025-08-07)
     - LLM_TEMPERATURE: Temperature setting (default: 0.7)
 
-    Returns:
-        ChatOpenAI: Configured LLM instance
-
     Raises:
         ValueError: If OPENAI_API_KEY is not set
     """
@@ -64,59 +88,68 @@ def get_llm():
             "Please set it in your .env file."
         )
 
-    model = os.getenv("LLM_MODEL", "gpt-5-nano-2025-08-07")
-    temperature = float(os.getenv("LLM_TEMPERATURE", "0.7"))
-
-    print(f"🤖 Using OpenAI: {model}")
-
-    return ChatOpenAI(
+    return LLMConfig(
         api_key=api_key,
-        model=model,
-        temperature=temperature
+        model=os.getenv("LLM_MODEL", "gpt-5-nano-2025-08-07"),
+        temperature=float(os.getenv("LLM_TEMPERATURE", "0.7"))
     )
 
 
-# ============================================================================
-# PROMPT ENGINEERING
-# ============================================================================
-
-def create_extraction_prompt(user_input: str) -> list:
+@functools.lru_cache(maxsize=1)
+def get_llm():
     """
-    Creates the prompt messages for the LLM.
-
-    This is critical for getting good results!
-
-    The prompt:
-    1. Explains the task clearly
-    2. Lists available components with examples
-    3. Specifies exact JSON format expected
-    4. Provides the user's request
+    Initialize and return the LLM instance.
 
-    Args:
-        user_input (str): The user's UI component request
+    Created once on first use and reused by every request. It shares the
+    pooled httpx client from propalyst_qa.get_http_client(), so connections
+    to OpenAI are kept alive between calls and the app's shutdown closes
+    a single pool.
+    Use get_llm.cache_clear() (and get_llm_config.cache_clear()) to pick up
+    changed environment variables.
 
     Returns:
-        list: List of LangChain message objects
+        ChatOpenAI: Configured LLM instance
 
-    Example:
-        >>> messages = create_extraction_prompt("button")
-        >>> # LLM will see system instructions + user request
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set
     """
+    config = get_llm_config()
+
+    logger.info("Using OpenAI: %s", config.model)
+
+    return ChatOpenAI(
+        api_key=config.api_key,
+        model=config.model,
+        temperature=config.temperature,
+        # JSON mode: the reply is always a bare JSON object (no prose to strip)
+        model_kwargs={"response_format": {"type": "json_object"}},
+        # Bounded per-attempt time; retries are owned by _call_llm (tenacity)
+        timeout=httpx.Timeout(20.0, connect=5.0),
+        max_retries=0,
+        http_async_client=get_http_client()
+    )
+
+
+# ============================================================================
+# PROMPT ENGINEERING
+# ============================================================================
 
-    # System message: Instructions for the LLM
-    system_prompt = f"""You are a UI component extraction specialist.
+# System message: Instructions for the LLM
+# Static, so it is built once at import and the same message object is reused.
+# It always comes first and only the short user message varies, so the
+# provider's automatic prompt-prefix cache can reuse it across requests.
+_SYSTEM_PROMPT = f"""You are a UI component extraction specialist.
 
 Your task: Extract structured component information from natural language requests.
 
 {get_component_schemas_text()}
 
 IMPORTANT RULES:
-1. Return ONLY valid JSON, no other text
-2. JSON must have "type" and "props" fields
-3. "type" must be one of: Button, TextArea, CheckboxGroup, Slider
-4. "props" must match the schema for that component type
-5. If the request is unclear, make reasonable assumptions
-6. For sliders, if defaultValue not specified, use the midpoint
+1. JSON must have "type" and "props" fields
+2. "type" must be one of: Button, TextArea, CheckboxGroup, Slider
+3. "props" must match the schema for that component type
+4. If the request is unclear, make reasonable assumptions
+5. For sliders, if defaultValue not specified, use the midpoint
 
 RESPONSE FORMAT (JSON only):
 {{
@@ -143,71 +176,144 @@ Output: {{"type": "Slider", "props": {{"min": 0, "max": 100, "defaultValue": 50,
 
 Now extract the component from the user's request."""
 
+_SYSTEM_MSG = SystemMessage(content=_SYSTEM_PROMPT)
+
+
+def create_extraction_prompt(user_input: str) -> list:
+    """
+    Creates the prompt messages for the LLM.
+
+    This is critical for getting good results!
+
+    The prompt:
+    1. Explains the task clearly
+    2. Lists available components with examples
+    3. Specifies exact JSON format expected
+    4. Provides the user's request
+
+    Args:
+        user_input (str): The user's UI component request
+
+    Returns:
+        list: List of LangChain message objects
+
+    Example:
+        >>> messages = create_extraction_prompt("button")
+        >>> # LLM will see system instructions + user request
+    """
+
     # Human message: The actual user request
     human_prompt = f"Extract component from: {user_input}"
 
     return [
-        SystemMessage(content=system_prompt),
+        _SYSTEM_MSG,
         HumanMessage(content=human_prompt)
     ]
 
 
 # ============================================================================
-# JSON PARSING
+# FAST PATH (no LLM)
 # ============================================================================
 
-def parse_llm_response(response_text: str) -> Dict[str, Any]:
+_BUTTON_RE = re.compile(r"^\s*(?:an?\s+)?button\s*$", re.I)
+_TEXT_AREA_RE = re.compile(r"^\s*(?:an?\s+)?text\s*area\s*$", re.I)
+_SLIDER_RE = re.compile(
+    r"^\s*(?:an?\s+)?slider\s+(?:from\s+)?(-?\d+)\s*(?:to|-)\s*(-?\d+)\s*$", re.I
+)
+_CHECKBOX_RE = re.compile(
+    r"^\s*(?:an?\s+)?checkbox(?:es)?(?:\s+group)?\s+with\s+options?\s+(.+?)\s*$", re.I
+)
+_OPTION_SPLIT_RE = re.compile(r"\s*(?:,|\band\b)\s*", re.I)
+
+
+def classify_ui_request(user_input: str) -> Optional[Dict[str, Any]]:
     """
-    Parse the LLM response and extract JSON.
+    Recognize trivial UI requests without calling the LLM.
 
-    LLMs sometimes add extra text, so we need to:
-    1. Find the JSON object in the response
-    2. Parse it safely
-    3. Validate the structure
+    Handles the fixed shapes from the prompt examples:
+    - "button" / "a button"
+    - "text area"
+    - "slider from 0 to 100" / "slider 0-100"
+    - "checkbox with options Apple, Banana and Orange"
 
-    Args:
-        response_text (str): Raw response from LLM
+    Anything else returns None and goes to the LLM (the correctness backstop).
 
     Returns:
-        dict: Parsed component configuration
-
-    Raises:
-        ValueError: If JSON is invalid or missing required fields
+        dict: Component data ({"type": ..., "props": ...}) or None
 
     Example:
-        >>> text = '{"type": "Button", "props": {"label": "Click"}}'
-        >>> result = parse_llm_response(text)
-        >>> print(result)
-        {'type': 'Button', 'props': {'label': 'Click'}}
+        >>> classify_ui_request("slider from 0 to 100")
+        {'type': 'Slider', 'props': {'min': 0, 'max': 100, 'defaultValue': 50, 'label': 'Select a value'}}
     """
-    try:
-        # Try to find JSON in the response
-        # LLM might return: "Here's the component: {json}"
-        # We need to extract just the {json} part
+    if _BUTTON_RE.match(user_input):
+        return {"type": "Button", "props": {"label": "Click Me", "variant": "primary"}}
+
+    if _TEXT_AREA_RE.match(user_input):
+        return {"type": "TextArea", "props": {"placeholder": "Enter your text here...", "rows": 4}}
+
+    match = _SLIDER_RE.match(user_input)
+    if match:
+        low, high = sorted((int(match.group(1)), int(match.group(2))))
+        return {
+            "type": "Slider",
+            "props": {"min": low, "max": high, "defaultValue": (low + high) // 2, "label": "Select a value"}
+        }
 
-        text = response_text.strip()
+    match = _CHECKBOX_RE.match(user_input)
+    if match:
+        options = [option for option in _OPTION_SPLIT_RE.split(match.group(1)) if option]
+        if options:
+            return {"type": "CheckboxGroup", "props": {"options": options, "label": "Select options"}}
 
-        # Find first { and last }
-        start = text.find('{')
-        end = text.rfind('}') + 1
+    return None
 
-        if start == -1 or end == 0:
-            raise ValueError("No JSON object found in response")
 
-        json_str = text[start:end]
-        data = json.loads(json_str)
+# ============================================================================
+# RESULT CACHE
+# ============================================================================
+
+# Normalized user_input -> parsed component dict from the LLM.
+# Repeated requests ("big red button", "Big  red button") skip the LLM.
+_COMPONENT_CACHE: LRUCache = LRUCache(maxsize=512)
+
+
+def _cache_key(user_input: str) -> str:
+    """Lowercase and collapse whitespace: "Big  Red button " -> "big red button"."""
+    return " ".join(user_input.lower().split())
+
+
+# ============================================================================
+# REQUEST BATCHING
+# ============================================================================
+
+MAX_BATCH = 16          # Max prompts sent in one abatch() call
+BATCH_WINDOW = 0.005    # Seconds to wait for more requests to join a batch
+
+
+# Concurrent extractions are sent together in one abatch() call
+_batcher = LLMBatcher(get_llm, max_batch=MAX_BATCH, window=BATCH_WINDOW)
 
-        # Validate required fields
-        if "type" not in data:
-            raise ValueError("Missing 'type' field in component")
 
-        if "props" not in data:
-            raise ValueError("Missing 'props' field in component")
+# Errors worth retrying: timeouts, dropped connections, rate limits and 5xx
+_TRANSIENT_ERRORS = (
+    httpx.TimeoutException,
+    httpx.TransportError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
 
-        return data
 
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in response: {e}")
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential_jitter(initial=0.2, max=2.0),
+    retry=retry_if_exception_type(_TRANSIENT_ERRORS),
+    reraise=True
+)
+async def _call_llm(user_input: str) -> str:
+    """Send one extraction through the batcher, retrying transient failures."""
+    return await _batcher.submit(create_extraction_prompt(user_input))
 
 
 # ============================================================================
@@ -250,29 +356,41 @@ async def extract_ui_component(state: AgentState) -> AgentState:
         UIComponent(type="Slider", props={"min": 0, "max": 100, ...})
     """
 
-    print(f"\n🔍 [UI Extractor] Processing: {state['user_input']}")
+    logger.debug("Processing: %s", state["user_input"])
 
     try:
-        # Step 1: Get LLM instance
-        llm = get_llm()
-
-        # Step 2: Create prompt
-        messages = create_extraction_prompt(state["user_input"])
-
-        # Step 3: Call LLM
-        print("📤 [UI Extractor] Calling LLM...")
-        response = await llm.ainvoke(messages)
-        response_text = response.content
-
-        print(f"📥 [UI Extractor] LLM Response: {response_text}")
-
-        # Step 4: Parse response
-        component_data = parse_llm_response(response_text)
+        # Step 0: Trivial requests ("button", "slider from 0 to 100") skip the LLM
+        component_data = classify_ui_request(state["user_input"])
+        llm_cache_key = None
+
+        if component_data is None:
+            cache_key = _cache_key(state["user_input"])
+            component_data = _COMPONENT_CACHE.get(cache_key)
+
+            if component_data is None:
+                # Steps 1-3: Build prompt and call LLM
+                # (micro-batched with other concurrent requests, see LLMBatcher)
+                logger.debug("Calling LLM...")
+                response_text = await _call_llm(state["user_input"])
+
+                logger.debug("LLM response: %s", response_text)
+
+                # Step 4: Parse response (JSON mode guarantees a bare JSON object)
+                component_data = orjson.loads(response_text)
+                llm_cache_key = cache_key
+            else:
+                logger.debug("Cache hit")
+        else:
+            logger.debug("Matched without LLM")
 
         # Step 5: Create UIComponent model
         component = UIComponent(**component_data)
 
-        print(f"✅ [UI Extractor] Extracted: {component.type}")
+        # Only cache LLM answers that produced a valid component
+        if llm_cache_key is not None:
+            _COMPONENT_CACHE[llm_cache_key] = component_data
+
+        logger.debug("Extracted: %s", component.type)
 
         # Step 6: Return updated state
         return AgentState(
@@ -285,7 +403,7 @@ async def extract_ui_component(state: AgentState) -> AgentState:
     except Exception as e:
         # Handle any errors gracefully
         error_message = f"Failed to extract component: {str(e)}"
-        print(f"❌ [UI Extractor] Error: {error_message}")
+        logger.warning("UI extraction failed: %s", error_message)
 
         return AgentState(
             user_input=state["user_input"],
@@ -295,6 +413,74 @@ async def extract_ui_component(state: AgentState) -> AgentState:
         )
 
 
+async def stream_ui_component(user_input: str) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a UI extraction: LLM tokens as they arrive, then the component.
+
+    Lets the frontend show progress (and start rendering once "type" shows
+    up) instead of waiting for the full completion. JSON mode guarantees the
+    concatenated tokens form one JSON object.
+
+    Args:
+        user_input (str): The user's UI component request
+
+    Yields:
+        dict events, in order:
+        - {"event": "token", "data": "<text chunk>"}  (zero or more)
+        - {"event": "component", "data": {"type": ..., "props": ...}}
+          or {"event": "error", "data": "<error message>"}
+
+    Example:
+        >>> async for event in stream_ui_component("big red button"):
+        ...     print(event["event"])
+        token
+        token
+        component
+    """
+    try:
+        component_data = classify_ui_request(user_input)
+
+        if component_data is None:
+            chunks = []
+            async for chunk in get_llm().astream(create_extraction_prompt(user_input)):
+                if chunk.content:
+                    chunks.append(chunk.content)
+                    yield {"event": "token", "data": chunk.content}
+            component_data = orjson.loads("".join(chunks))
+
+        component = UIComponent(**component_data)
+        yield {"event": "component", "data": component.model_dump()}
+
+    except Exception as e:
+        error_message = f"Failed to extract component: {str(e)}"
+        logger.warning("UI extraction failed: %s", error_message)
+        yield {"event": "error", "data": error_message}
+
+
+async def extract_ui_components_batch(user_inputs: List[str]) -> List[AgentState]:
+    """
+    Extract components for several requests at once.
+
+    All extractions run concurrently, so their LLM calls land in the same
+    abatch() call(s) instead of one round-trip each.
+
+    Args:
+        user_inputs: List of UI component requests
+
+    Returns:
+        List of AgentState results, in the same order as user_inputs
+
+    Example:
+        >>> results = await extract_ui_components_batch(["button", "slider 0-10"])
+        >>> [r["component"].type for r in results]
+        ["Button", "Slider"]
+    """
+    return await asyncio.gather(*[
+        extract_ui_component(create_initial_state(user_input))
+        for user_input in user_inputs
+    ])
+
+
 # ============================================================================
 # SYNCHRONOUS WRAPPER (for testing)
 # ============================================================================
@@ -318,8 +504,6 @@ def extract_ui_component_sync(state: AgentState) -> AgentState:
         >>> print(result["component"].type)
         "Button"
     """
-    import asyncio
-
     # Run the async function in a sync context
     return asyncio.run(extract_ui_component(state))
 
@@ -330,8 +514,12 @@ def extract_ui_component_sync(state: AgentState) -> AgentState:
 
 __all__ = [
     "extract_ui_component",
+    "extract_ui_components_batch",
+    "stream_ui_component",
     "extract_ui_component_sync",
     "get_llm",
+    "get_llm_config",
+    "LLMConfig",
     "create_extraction_prompt",
-    "parse_llm_response"
+    "classify_ui_request"
 ]
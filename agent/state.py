@@ -8,7 +8,7 @@ Key Concepts:
 -------------
 1. TypedDict: Defines the shape of state that flows through the graph
 2. Pydantic Models: Used for validation and serialization
-3. State is immutable: Nodes return NEW state, don't modify existing
+3. Nodes return only the keys they change; LangGraph merges them into state
 
 Why we need state:
 ------------------
@@ -17,8 +17,10 @@ Why we need state:
 - LangGraph manages state transitions automatically
 """
 
+import json
+from types import MappingProxyType
 from typing import TypedDict, Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # ============================================================================
@@ -42,6 +44,9 @@ class UIComponent(BaseModel):
             }
         }
     """
+    # Allow extra fields in props (flexible for different component types)
+    model_config = ConfigDict(extra="allow")
+
     type: str = Field(
         ...,
         description="Component type: Button, TextArea, CheckboxGroup, Slider"
@@ -51,10 +56,6 @@ class UIComponent(BaseModel):
         description="Component-specific properties"
     )
 
-    class Config:
-        # Allow extra fields in props (flexible for different component types)
-        extra = "allow"
-
 
 # ============================================================================
 # LANGGRAPH STATE (TypedDict)
@@ -101,6 +102,11 @@ class AgentState(TypedDict):
         Error message if something went wrong
         None if no error
         Example: "Could not understand the component request"
+
+    Like PropalystState, this stays a TypedDict: LangGraph builds and merges
+    the state as a plain dict anyway, so a slots dataclass here would only
+    add a conversion at each graph boundary. New states are cheap copies of
+    _INITIAL_STATE_TEMPLATE (see create_initial_state).
     """
 
     # Required fields
@@ -126,6 +132,12 @@ class PropalystState(TypedDict):
     3. User refines search
     4. Agent shows properties
 
+    Kept as a plain TypedDict on purpose: LangGraph merges node deltas into
+    a dict, sessions store it as a dict, and routers read it with .get().
+    A slots dataclass would need a to_dict()/from_dict() copy at every graph
+    and session boundary, which costs more than the handful of key lookups
+    it saves. Hot paths bind state.get once and walk a field table instead.
+
     Fields:
     -------
     session_id (str):
@@ -213,6 +225,25 @@ class PropalystState(TypedDict):
     error: Optional[str]
 
 
+# Default values for a new session (copied, never mutated)
+_PROPALYST_STATE_TEMPLATE = PropalystState(
+    session_id="",
+    work_location=None,
+    has_kids=None,
+    commute_time_max=None,
+    property_type=None,
+    budget_max=None,
+    recommended_areas=None,
+    selected_area=None,
+    calculated=False,
+    messages=[],
+    current_step=1,
+    component=None,
+    message="",
+    error=None
+)
+
+
 def create_propalyst_state(session_id: str) -> PropalystState:
     """
     Creates initial Propalyst state for a new session.
@@ -230,28 +261,23 @@ def create_propalyst_state(session_id: str) -> PropalystState:
         >>> state["work_location"]
         None
     """
-    return PropalystState(
-        session_id=session_id,
-        work_location=None,
-        has_kids=None,
-        commute_time_max=None,
-        property_type=None,
-        budget_max=None,
-        recommended_areas=None,
-        selected_area=None,
-        calculated=False,
-        messages=[],
-        current_step=1,
-        component=None,
-        message="",
-        error=None
-    )
+    # Shallow copy of the template; messages gets its own list per session
+    return {**_PROPALYST_STATE_TEMPLATE, "session_id": session_id, "messages": []}
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Default values for a new UI generation run (copied, never mutated)
+_INITIAL_STATE_TEMPLATE = AgentState(
+    user_input="",
+    component=None,
+    message="",
+    error=None
+)
+
+
 def create_initial_state(user_input: str) -> AgentState:
     """
     Creates the initial state for the workflow.
@@ -272,12 +298,7 @@ def create_initial_state(user_input: str) -> AgentState:
             "error": None
         }
     """
-    return AgentState(
-        user_input=user_input,
-        component=None,
-        message="",
-        error=None
-    )
+    return {**_INITIAL_STATE_TEMPLATE, "user_input": user_input}
 
 
 def create_error_state(user_input: str, error_message: str) -> AgentState:
@@ -310,6 +331,7 @@ def create_error_state(user_input: str, error_message: str) -> AgentState:
 
 # These define what components are available and their props
 # The LLM will use these to generate valid component configurations
+# Read-only: exposed as a MappingProxyType (see below), example option lists are tuples
 
 COMPONENT_SCHEMAS = {
     "Button": {
@@ -349,7 +371,7 @@ COMPONENT_SCHEMAS = {
         "example": {
             "type": "CheckboxGroup",
             "props": {
-                "options": ["Apple", "Banana", "Orange"],
+                "options": ("Apple", "Banana", "Orange"),
                 "label": "Select fruits"
             }
         }
@@ -374,6 +396,25 @@ COMPONENT_SCHEMAS = {
     }
 }
 
+# Freeze the top level so no caller can add/replace schemas at runtime
+COMPONENT_SCHEMAS = MappingProxyType(COMPONENT_SCHEMAS)
+
+
+def _build_schemas_text() -> str:
+    """Render COMPONENT_SCHEMAS as prompt text (see get_component_schemas_text)."""
+    blocks = [
+        f"{i}. {name}\n"
+        "   Props:\n"
+        + "".join(f"   - {prop_name}: {prop_desc}\n" for prop_name, prop_desc in schema["props"].items())
+        + f"   Example: {json.dumps(schema['example'], separators=(',', ':'))}\n"
+        for i, (name, schema) in enumerate(COMPONENT_SCHEMAS.items(), 1)
+    ]
+    return "Available components:\n\n" + "\n".join(blocks) + "\n"
+
+
+# COMPONENT_SCHEMAS is static, so the prompt text is rendered once at import
+_SCHEMAS_TEXT = _build_schemas_text()
+
 
 def get_component_schemas_text() -> str:
     """
@@ -382,6 +423,9 @@ def get_component_schemas_text() -> str:
     This helps the LLM understand what components are available
     and how to structure the props.
 
+    The text is rendered once at import (_SCHEMAS_TEXT); examples are
+    compact JSON, the same format the LLM is asked to answer in.
+
     Returns:
         str: Formatted component schemas
 
@@ -393,28 +437,13 @@ def get_component_schemas_text() -> str:
            Props:
            - label: string (the button text)
            - variant: string (optional: 'primary', 'secondary', 'outline')
-           Example:
-           {
-             "type": "Button",
-             "props": { "label": "Click Me", "variant": "primary" }
-           }
+           Example: {"type":"Button","props":{"label":"Click Me","variant":"primary"}}
 
         2. TextArea
            ...
         ```
     """
-    schemas_text = "Available components:\n\n"
-
-    for i, (name, schema) in enumerate(COMPONENT_SCHEMAS.items(), 1):
-        schemas_text += f"{i}. {name}\n"
-        schemas_text += "   Props:\n"
-
-        for prop_name, prop_desc in schema["props"].items():
-            schemas_text += f"   - {prop_name}: {prop_desc}\n"
-
-        schemas_text += f"   Example: {schema['example']}\n\n"
-
-    return schemas_text
+    return _SCHEMAS_TEXT
 
 
 # ============================================================================
@@ -0,0 +1,331 @@
+"""
+FastAPI Application Factory - Dynamic UI Generator
+===================================================
+
+Builds the FastAPI app for the backend API. main.py is only the entry
+point: `app = create_app()`.
+
+Key Components:
+---------------
+1. FastAPI app with CORS
+2. Environment variable loading
+3. Router registration
+4. LangGraph workflow initialization
+
+Why a factory?
+--------------
+Importing this module has no side effects: .env loading, settings, CORS
+and routes are all set up inside create_app(), and the graphs are only
+compiled when the app starts (see lifespan). Tests and tools can build a
+fresh app, with every route registered, whenever they need one.
+
+Endpoints:
+----------
+- GET  /              Health check
+- GET  /health         Detailed health check
+- POST /api/generate-ui   Generate UI component (via ui_router)
+- GET  /api/components    List components (via ui_router)
+- POST /api/propalyst/chat    Propalyst chat (via propalyst_router)
+- POST /api/propalyst/summary Propalyst summary (via propalyst_router)
+- POST /api/propalyst/areas   Propalyst areas (via propalyst_router)
+- POST /api/property-search    Property search (via search_router)
+
+Example:
+--------
+    >>> from app_factory import create_app
+    >>> app = create_app()
+"""
+
+import asyncio
+import logging
+import functools
+import orjson
+from pathlib import Path
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
+from dotenv import load_dotenv
+
+from middleware import FastCORS
+from settings import get_settings
+from logging_setup import setup_logging, stop_logging
+
+# Local-development env file, next to this module (absent in production,
+# where the orchestrator injects the environment)
+ENV_FILE = Path(__file__).with_name(".env")
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# STARTUP/SHUTDOWN (lifespan)
+# ============================================================================
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Runs once around the application's lifetime.
+
+    Before yield (startup):
+    - Start queued, non-blocking logging (see logging_setup.py)
+    - Compile both LangGraph workflows concurrently, off the event loop
+    - Warm up the Propalyst graph and the summary LLM (see _warmup)
+
+    After yield (shutdown):
+    - Close the shared OpenAI HTTP client (if one was opened)
+    - Close the shared scraper browser (if one was started)
+    - Flush and stop the logging thread
+    """
+    import graphs
+
+    setup_logging(get_settings().log_level)
+
+    # Compile both LangGraph workflows concurrently (off the event loop)
+    app.state.ui_graph, app.state.propalyst_graph = await graphs.build_graphs()
+
+    llm_warmup = await _warmup(app)
+
+    print("\n" + "="*60)
+    print("🚀 Dynamic UI Generator API Starting...")
+    print("="*60)
+    print(f"📍 API Documentation: http://localhost:8000/docs")
+    print(f"📍 Health Check: http://localhost:8000/health")
+    print("="*60 + "\n")
+
+    yield
+
+    print("\n" + "="*60)
+    print("👋 Shutting down Dynamic UI Generator API")
+    print("="*60 + "\n")
+
+    if llm_warmup is not None:
+        llm_warmup.cancel()
+
+    from agent.nodes import propalyst_qa, ui_extractor
+
+    # Only close the pooled client (shared by both nodes' LLMs) if a request
+    # actually created it; the cached LLMs hold it, so drop them too
+    if propalyst_qa.get_http_client.cache_info().currsize:
+        await propalyst_qa.get_http_client().aclose()
+        propalyst_qa.get_http_client.cache_clear()
+        propalyst_qa.get_llm.cache_clear()
+        ui_extractor.get_llm.cache_clear()
+
+    from providers.scrapers.crawler import close_crawler
+    await close_crawler()
+
+    stop_logging()
+
+
+async def _warmup(app: FastAPI) -> "asyncio.Task | None":
+    """
+    Take the cold-start cost before the first real request does.
+
+    - Propalyst graph: one throwaway run (first question only; no LLM call,
+      no session saved), awaited so the first /chat hits a warm graph
+    - Summary LLM: a 1-token request that opens its connection pool and
+      primes the provider's prompt cache with the shared system prompt.
+      Runs in the background so a slow or unreachable API never delays
+      startup; set WARMUP_LLM=false to skip it.
+
+    Failures are logged and ignored. Returns the LLM warmup task (or None)
+    so shutdown can cancel it.
+    """
+    from agent.state import create_propalyst_state
+
+    try:
+        await app.state.propalyst_graph.ainvoke(create_propalyst_state("warmup"))
+    except Exception as e:
+        logger.warning("Propalyst graph warmup failed: %s", e)
+
+    if not get_settings().warmup_llm:
+        return None
+
+    from langchain_core.messages import HumanMessage
+    from routers.propalyst_router import get_summary_llm, _SUMMARY_SYSTEM_MESSAGE
+
+    async def warm_summary_llm():
+        try:
+            await get_summary_llm().bind(max_tokens=1).ainvoke(
+                [_SUMMARY_SYSTEM_MESSAGE, HumanMessage(content="warmup")]
+            )
+            logger.debug("Summary LLM warmed up")
+        except Exception as e:
+            logger.warning("Summary LLM warmup failed: %s", e)
+
+    return asyncio.create_task(warm_summary_llm())
+
+
+# ============================================================================
+# INCLUDE ROUTERS
+# ============================================================================
+
+def _register_routers(app: FastAPI) -> None:
+    """
+    Import and include the feature routers.
+
+    Imported here rather than at module level so that merely importing the
+    app module (CLI tools, test collection) doesn't pull in LangGraph, the
+    LLM SDKs and the scrapers until an app is actually built.
+    """
+    from routers import ui_router, propalyst_router, search_router, scraping_router
+
+    # Plain include_router is enough here: four shallow routers with a
+    # handful of routes each are included in well under a millisecond
+    for router in (ui_router, propalyst_router, search_router, scraping_router):
+        app.include_router(router)
+
+
+# ============================================================================
+# HEALTH CHECK ENDPOINTS
+# ============================================================================
+
+# The root payload never changes: serialized once at import
+_ROOT_BYTES = orjson.dumps({
+    "message": "Dynamic UI Generator API",
+    "version": "2.0.0",
+    "status": "running",
+    "projects": {
+        "project_1": "Dynamic UI Generator (one-shot)",
+        "project_2": "Propalyst Q&A (multi-step conversations)",
+        "project_3": "Property Search (Gemini grounding)"
+    },
+    "docs": "/docs",
+    "endpoints": {
+        "health": "/",
+        "health_detailed": "/health",
+        "project_1": {
+            "generate_ui": "/api/generate-ui",
+            "components": "/api/components"
+        },
+        "project_2": {
+            "propalyst_chat": "/api/propalyst/chat",
+            "propalyst_summary": "/api/propalyst/summary",
+            "propalyst_areas": "/api/propalyst/areas"
+        },
+        "project_3": {
+            "property_search": "/api/property-search"
+        }
+    }
+})
+_ROOT_HEADERS = {"cache-control": "public, max-age=60"}
+
+
+async def root():
+    """
+    Health check endpoint.
+
+    The response body is a constant, pre-serialized at import (_ROOT_BYTES).
+
+    Returns:
+        Basic API information (JSON)
+
+    Example:
+        GET http://localhost:8000/
+        Response: {
+            "message": "Dynamic UI Generator API",
+            "version": "2.0.0",
+            "status": "running"
+        }
+    """
+    return Response(content=_ROOT_BYTES, media_type="application/json", headers=_ROOT_HEADERS)
+
+
+@functools.lru_cache(maxsize=8)
+def _health_bytes(has_api_key: bool, has_ui_graph: bool, has_propalyst_graph: bool) -> bytes:
+    """Serialized /health payload; only 8 possible inputs, so each is built once."""
+    return orjson.dumps({
+        "status": "healthy" if (has_api_key and has_ui_graph and has_propalyst_graph) else "degraded",
+        "checks": {
+            "api_running": True,
+            "openai_api_key_set": has_api_key,
+            "ui_generator_initialized": has_ui_graph,
+            "propalyst_graph_initialized": has_propalyst_graph
+        },
+        "warnings": [] if has_api_key else ["OPENAI_API_KEY not set"]
+    })
+
+
+async def health_check():
+    """
+    Detailed health check endpoint.
+
+    Checks:
+    - API is running
+    - Environment variables are set
+    - LangGraph workflows are initialized
+
+    Returns:
+        Health status information (JSON)
+    """
+    import graphs
+
+    return Response(
+        content=_health_bytes(
+            get_settings().openai_api_key_set,
+            *graphs.graphs_ready()
+        ),
+        media_type="application/json"
+    )
+
+
+# ============================================================================
+# APP FACTORY
+# ============================================================================
+
+def create_app() -> FastAPI:
+    """
+    Build and configure the FastAPI application.
+
+    Steps:
+    ------
+    1. Load environment variables from .env (skipped when there is no .env)
+    2. Create the FastAPI app with the lifespan (graphs compiled at startup)
+    3. Add CORS middleware
+    4. Register the feature routers
+    5. Add the health check endpoints
+
+    Returns:
+        FastAPI: The configured application
+    """
+
+    # Step 1: Load environment variables from .env file (if there is one)
+    # A single stat() in production instead of running the dotenv search/parser
+    if ENV_FILE.is_file():
+        load_dotenv(ENV_FILE)
+
+    # Step 2: Create the app
+    # No default_response_class=ORJSONResponse: routes with a response_model are
+    # already serialized straight to JSON bytes by Pydantic's Rust core, and a
+    # custom default class would switch that fast path off. Constant payloads
+    # (/, /health, chat components) are pre-serialized with orjson instead.
+    app = FastAPI(
+        title="Dynamic UI Generator API",
+        description="LangGraph-powered API for generating UI components from natural language",
+        version="2.0.0",
+        docs_url="/docs",  # Swagger UI
+        redoc_url="/redoc",  # ReDoc alternative
+        lifespan=lifespan
+    )
+
+    # Step 3: CORS
+    # Get allowed origins from the CORS_ORIGINS environment variable (see settings.py)
+    # Parsed once; FastCORS keeps them as a frozenset for O(1) origin checks
+    cors_origins = get_settings().cors_origins
+
+    print(f"🌐 CORS enabled for origins: {cors_origins}")
+
+    # Pure-ASGI CORS (see middleware/cors.py): credentials on, all methods and
+    # headers allowed, header bytes precomputed once instead of per request
+    app.add_middleware(FastCORS, origins=cors_origins)
+
+    # Step 4: Feature routers (/api/...)
+    _register_routers(app)
+
+    # Step 5: Health check endpoints
+    app.add_api_route("/", root, methods=["GET"])
+    app.add_api_route("/health", health_check, methods=["GET"])
+
+    return app
+
+
+__all__ = ["create_app"]
@@ -2,24 +2,54 @@
 Graph Instances Module
 ======================
 
-Centralized initialization of LangGraph workflow instances.
-This module ensures graphs are initialized once and can be imported by routers.
+Centralized, lazy initialization of LangGraph workflow instances.
+
+Nothing is compiled at import time: each graph is built the first time
+its getter is called (normally by the app's startup lifespan, which warms
+both concurrently via build_graphs()), then reused by every request.
+
+The getters are aliases of the lru-cached create_*_graph() factories, so
+the factory cache is the single place the compiled graphs live.
 """
 
+import asyncio
+import logging
+from typing import Any, Tuple
+
 from agent import create_ui_generator_graph
 from agent.graph import create_propalyst_graph
 
-# Initialize graphs at module level
-# These will be created when the module is first imported
+logger = logging.getLogger(__name__)
+
 
-print("[INIT] Initializing UI Generator workflow...")
-ui_generator_graph = create_ui_generator_graph()
-print("[INIT] UI Generator workflow ready!")
+# Return the compiled workflow, building it on first call.
+#
+# Example:
+#     >>> graph = get_propalyst_graph()
+#     >>> result = await graph.ainvoke(create_propalyst_state("abc-123"))
+get_ui_generator_graph = create_ui_generator_graph
+get_propalyst_graph = create_propalyst_graph
 
-print("[INIT] Initializing Propalyst Q&A workflow...")
-propalyst_graph = create_propalyst_graph()
-print("[INIT] Propalyst Q&A workflow ready!")
 
+async def build_graphs() -> Tuple[Any, Any]:
+    """
+    Compile both workflows concurrently, off the event loop.
 
+    Returns:
+        (ui_generator_graph, propalyst_graph)
+    """
+    logger.info("Initializing LangGraph workflows...")
+    ui_graph, propalyst_graph = await asyncio.gather(
+        asyncio.to_thread(get_ui_generator_graph),
+        asyncio.to_thread(get_propalyst_graph)
+    )
+    logger.info("LangGraph workflows ready")
+    return ui_graph, propalyst_graph
 
 
+def graphs_ready() -> Tuple[bool, bool]:
+    """Return whether each workflow has been compiled yet (for /health)."""
+    return (
+        get_ui_generator_graph.cache_info().currsize > 0,
+        get_propalyst_graph.cache_info().currsize > 0
+    )
@@ -0,0 +1,81 @@
+"""
+Logging Setup
+=============
+
+Non-blocking logging for the API process.
+
+Key Concepts:
+-------------
+1. Request handlers only put log records on an in-memory queue
+   (QueueHandler), which never touches stdout
+2. A QueueListener thread formats the records and writes them to stderr,
+   so the stream lock and the write syscall are off the event loop
+3. The level comes from LOG_LEVEL (see settings.py); records below it are
+   dropped at the logger.debug() call, before any formatting happens
+
+Example:
+--------
+    >>> listener = setup_logging("DEBUG")
+    >>> logging.getLogger("agent").debug("visible")
+    >>> stop_logging()
+"""
+
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import Optional
+
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# The running listener (None until setup_logging is called)
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: str = "INFO") -> QueueListener:
+    """
+    Route the root logger through a queue to a background writer thread.
+
+    Safe to call more than once: later calls only update the level.
+
+    Args:
+        level: Root log level name, e.g. "INFO" or "DEBUG"
+
+    Returns:
+        QueueListener: The running listener (stop it with stop_logging)
+    """
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel(level.upper())
+
+    if _listener is None:
+        queue = SimpleQueue()
+
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        root.addHandler(QueueHandler(queue))
+        _listener = QueueListener(queue, handler, respect_handler_level=True)
+        _listener.start()
+
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background writer thread."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+        root = logging.getLogger()
+        for handler in [h for h in root.handlers if isinstance(h, QueueHandler)]:
+            root.removeHandler(handler)
+
+
+__all__ = [
+    "setup_logging",
+    "stop_logging"
+]
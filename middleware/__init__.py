@@ -0,0 +1,12 @@
+"""
+ASGI Middleware
+===============
+
+Lightweight pure-ASGI middleware used by the FastAPI app.
+"""
+
+from .cors import FastCORS
+
+__all__ = [
+    "FastCORS"
+]
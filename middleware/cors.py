@@ -0,0 +1,141 @@
+"""
+Pure-ASGI CORS Middleware
+=========================
+
+A small replacement for Starlette's CORSMiddleware, specialised for this
+app's policy: a fixed list of allowed origins, credentials allowed, all
+methods and all request headers allowed.
+
+Why not CORSMiddleware?
+-----------------------
+- Everything that doesn't depend on the request (allowed methods, the
+  credentials flag, max-age) is encoded to header bytes once, here.
+- A normal request costs one header lookup and, for allowed origins, a
+  few tuples appended to the response start message.
+- Non-HTTP scopes (lifespan, websockets) pass straight through.
+
+Behaviour matches CORSMiddleware for this policy:
+- Preflight (OPTIONS + Origin + Access-Control-Request-Method) from an
+  allowed origin → 200 with the CORS headers, requested headers echoed
+  back (a literal "*" isn't honoured by browsers when credentials are on)
+- Preflight from any other origin → 400 "Disallowed CORS origin"
+- Other requests from an allowed origin → response gets the CORS headers,
+  with Origin merged into an existing Vary header rather than a second one
+"""
+
+from typing import Iterable
+
+
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_MAX_AGE = b"600"
+
+
+class FastCORS:
+    """
+    Pure-ASGI CORS middleware with precomputed header bytes.
+
+    Args:
+        app: The ASGI app to wrap
+        origins: Allowed origins, e.g. ["http://localhost:3000"]
+
+    Example:
+        >>> app.add_middleware(FastCORS, origins=["http://localhost:3000"])
+    """
+
+    def __init__(self, app, origins: Iterable[str]):
+        self.app = app
+        self._origins = frozenset(origin.encode("latin-1") for origin in origins)
+
+        # Static parts of every CORS response, built once
+        self._simple_headers = (
+            (b"access-control-allow-credentials", b"true"),
+        )
+        self._preflight_headers = (
+            (b"access-control-allow-methods", _ALLOW_METHODS),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-max-age", _MAX_AGE),
+            (b"vary", b"Origin"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", b"2"),
+        )
+
+        # The rejected-preflight response is fully static
+        body = b"Disallowed CORS origin"
+        self._disallowed_start = {
+            "type": "http.response.start",
+            "status": 400,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", b"%d" % len(body)),
+            ],
+        }
+        self._disallowed_body = {"type": "http.response.body", "body": body}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Not a cross-origin request: nothing to do
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = origin in self._origins
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin if allowed else None, request_headers)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = ((b"access-control-allow-origin", origin),) + self._simple_headers
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.extend(cors_headers)
+                _add_vary_origin(headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, send, origin, request_headers):
+        """Answer a preflight request directly, without calling the app."""
+        if origin is None:
+            await send(self._disallowed_start)
+            await send(self._disallowed_body)
+            return
+
+        headers = [(b"access-control-allow-origin", origin), *self._preflight_headers]
+        if request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b"OK"})
+
+
+def _add_vary_origin(headers: list) -> None:
+    """Add Origin to the Vary header, merging into an existing one (like Starlette)."""
+    for i, (name, value) in enumerate(headers):
+        if name.lower() == b"vary":
+            headers[i] = (name, value + b", Origin")
+            return
+    headers.append((b"vary", b"Origin"))
+
+
+__all__ = ["FastCORS"]
@@ -5,10 +5,16 @@ Old: { "url": [ properties ] } or { "url": { "type": "provider", "source_url": "
 New: [ { "type": "provider", "source_url": "url", "scraped_at": "timestamp", "data": [ properties ] }, ... ]
 """
 
-import json
+import os
+import re
+import shutil
+import orjson
 from datetime import datetime
 from pathlib import Path
 
+# Provider name in a listing URL, found in one case-insensitive scan
+_SOURCE_RE = re.compile(r"squareyards|magicbricks", re.IGNORECASE)
+
 def migrate_cache():
     cache_path = Path(__file__).parent / "data" / "scraped_properties.json"
 
@@ -17,8 +23,9 @@ def migrate_cache():
         return
 
     print(f"Reading cache file: {cache_path}")
-    with open(cache_path, 'r', encoding='utf-8') as f:
-        old_data = json.load(f)
+    # orjson parses the raw UTF-8 bytes directly (no text-mode decode)
+    with open(cache_path, 'rb') as f:
+        old_data = orjson.loads(f.read())
 
     # If already an array, it's already migrated
     if isinstance(old_data, list):
@@ -34,12 +41,8 @@ def migrate_cache():
 
     for url, entry in old_data.items():
         # Determine source based on URL
-        if "squareyards" in url.lower():
-            source = "squareyards"
-        elif "magicbricks" in url.lower():
-            source = "magicbricks"
-        else:
-            source = "unknown"
+        match = _SOURCE_RE.search(url)
+        source = match.group().lower() if match else "unknown"
 
         # Handle both old and intermediate formats
         if isinstance(entry, dict) and "data" in entry:
@@ -65,13 +68,24 @@ def migrate_cache():
     # Backup old file
     backup_path = cache_path.with_suffix('.backup.json')
     print(f"\nBacking up old file to: {backup_path}")
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump(old_data, f, indent=2, ensure_ascii=False)
+    # Hardlink the original file instead of copying its bytes; the link keeps
+    # the old contents because the new file replaces the path, not the inode
+    backup_path.unlink(missing_ok=True)
+    try:
+        os.link(cache_path, backup_path)
+    except OSError:
+        # Filesystem without hardlinks
+        shutil.copy2(cache_path, backup_path)
 
     # Write new file as array
     print(f"Writing migrated cache to: {cache_path}")
-    with open(cache_path, 'w', encoding='utf-8') as f:
-        json.dump(new_data, f, indent=2, ensure_ascii=False)
+    # Write to a temp file and swap it in, so an interrupted run never
+    # leaves a half-written cache. orjson writes non-ASCII as UTF-8
+    # (like ensure_ascii=False)
+    tmp_path = cache_path.with_suffix('.json.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(new_data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_path, cache_path)
 
     print(f"\n✓ Migration complete!")
     print(f"  - Old entries: {len(old_data)}")
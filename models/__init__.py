@@ -8,6 +8,7 @@ Pydantic models for data validation and serialization.
 from .search import PropertySearchParams, SearchResponse, PropertyResult
 from .ui import GenerateUIRequest, GenerateUIResponse, UIComponentResponse
 from .propalyst import (
+    SessionRequest,
     PropalystChatRequest,
     PropalystChatResponse,
     PropalystSummaryRequest,
@@ -26,6 +27,7 @@ __all__ = [
     "GenerateUIResponse",
     "UIComponentResponse",
     # Propalyst models
+    "SessionRequest",
     "PropalystChatRequest",
     "PropalystChatResponse",
     "PropalystSummaryRequest",
@@ -5,10 +5,27 @@ Propalyst Models
 Pydantic models for Propalyst endpoints.
 """
 
-from pydantic import BaseModel
+from typing import Any
 
+from pydantic import BaseModel, ConfigDict
 
-class PropalystChatRequest(BaseModel):
+# Responses are built only by this server, so an unknown field is a bug.
+# Requests keep Pydantic's default (unknown fields ignored) so an older or
+# newer frontend sending an extra key doesn't get a 422.
+_RESPONSE_CONFIG = ConfigDict(extra="forbid")
+
+
+class SessionRequest(BaseModel):
+    """
+    Base for Propalyst requests: every one is keyed by session_id.
+
+    Attributes:
+        session_id (str): Unique session identifier (UUID)
+    """
+    session_id: str
+
+
+class PropalystChatRequest(SessionRequest):
     """
     Request model for Propalyst conversational endpoint.
 
@@ -16,6 +33,9 @@ class PropalystChatRequest(BaseModel):
         session_id (str): Unique session identifier (UUID)
         user_input (str | None): User's answer (None for initial request)
         field (str | None): Which field this answer is for
+            (omit it to extract every answer mentioned in user_input)
+        answers (dict | None): Several answers at once, field → user input
+            (validated concurrently; takes precedence over user_input/field)
 
     Examples:
         Initial request (start conversation):
@@ -37,19 +57,24 @@ class PropalystChatRequest(BaseModel):
             "user_input": "Yes",
             "field": "has_kids"
         }
+
+        Bulk answers:
+        {
+            "session_id": "abc-123",
+            "answers": {"work_location": "Whitefield", "has_kids": "Yes"}
+        }
     """
-    session_id: str
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "session_id": "abc-123",
+            "user_input": "Whitefield",
+            "field": "work_location"
+        }
+    })
+
     user_input: str | None = None
     field: str | None = None
-
-    class Config:
-        schema_extra = {
-            "example": {
-                "session_id": "abc-123",
-                "user_input": "Whitefield",
-                "field": "work_location"
-            }
-        }
+    answers: dict[str, str] | None = None
 
 
 class PropalystChatResponse(BaseModel):
@@ -78,14 +103,16 @@ class PropalystChatResponse(BaseModel):
             "completed": false
         }
     """
-    component: dict | None
+    model_config = _RESPONSE_CONFIG
+
+    component: dict[str, Any] | None
     message: str
     session_id: str
     current_step: int
     completed: bool
 
 
-class PropalystSummaryRequest(BaseModel):
+class PropalystSummaryRequest(SessionRequest):
     """
     Request model for generating conversation summary.
 
@@ -97,7 +124,6 @@ class PropalystSummaryRequest(BaseModel):
             "session_id": "abc-123"
         }
     """
-    session_id: str
 
 
 class PropalystSummaryResponse(BaseModel):
@@ -114,11 +140,13 @@ class PropalystSummaryResponse(BaseModel):
             "session_id": "abc-123"
         }
     """
+    model_config = _RESPONSE_CONFIG
+
     summary: str
     session_id: str
 
 
-class PropalystAreasRequest(BaseModel):
+class PropalystAreasRequest(SessionRequest):
     """
     Request model for fetching recommended areas.
 
@@ -130,7 +158,6 @@ class PropalystAreasRequest(BaseModel):
             "session_id": "abc-123"
         }
     """
-    session_id: str
 
 
 class PropalystAreasResponse(BaseModel):
@@ -138,7 +165,7 @@ class PropalystAreasResponse(BaseModel):
     Response model for recommended areas.
 
     Attributes:
-        areas (list): List of recommended area objects
+        areas (list[dict]): List of recommended area objects
         session_id (str): Session identifier
 
     Example:
@@ -157,9 +184,7 @@ class PropalystAreasResponse(BaseModel):
             "session_id": "abc-123"
         }
     """
-    areas: list
-    session_id: str
-
-
-
+    model_config = _RESPONSE_CONFIG
 
+    areas: list[dict[str, Any]]
+    session_id: str
@@ -5,7 +5,7 @@ UI Generation Models
 Pydantic models for UI generation endpoints.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class GenerateUIRequest(BaseModel):
@@ -20,14 +20,13 @@ class GenerateUIRequest(BaseModel):
             "user_input": "checkbox with options Apple, Banana, Orange"
         }
     """
-    user_input: str
-
-    class Config:
-        schema_extra = {
-            "example": {
-                "user_input": "button with label 'Submit'"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "user_input": "button with label 'Submit'"
         }
+    })
+
+    user_input: str
 
 
 class UIComponentResponse(BaseModel):
@@ -7,14 +7,51 @@ Property search using Google Gemini API with Search Grounding.
 Official documentation: https://ai.google.dev/gemini-api/docs/google-search#python
 """
 
-import json
-from typing import List
+import logging
+import orjson
+from typing import List, Tuple
+from cachetools import TTLCache
 from google import genai
 from google.genai import types
 
 from models.search import PropertySearchParams, PropertyResult, GroundingSource
 from .base import BaseSearchProvider
 
+logger = logging.getLogger(__name__)
+
+
+# Source name -> domain for the site: search operator
+_SITE_MAP = {
+    "magicbricks": "magicbricks.com",
+    "housing": "housing.com",
+    "99acres": "99acres.com",
+    "nobroker": "nobroker.com",
+    "commonfloor": "commonfloor.com",
+    "squareyards": "squareyards.com"
+}
+
+
+# Normalized query -> extracted PropertySearchParams. Shared by every
+# provider instance (the router builds one per request); 1 hour TTL.
+_PARAMS_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+
+def _params_cache_key(query: str) -> str:
+    """Lowercase and collapse whitespace: " 3BHK  in HSR " -> "3bhk in hsr"."""
+    return " ".join(query.lower().split())
+
+
+# (params, sources) -> grounded search results. Search is read-only, so an
+# identical search within the TTL (listing freshness: 1 hour) reuses the
+# results instead of another grounded generation.
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=512, ttl=3600)
+
+
+def _search_cache_key(params: PropertySearchParams, source: str) -> Tuple[bytes, str]:
+    """Canonical (sorted-key JSON of the set params, normalized source list)."""
+    sources = ",".join(sorted(s.strip().lower() for s in source.split(",") if s.strip()))
+    return orjson.dumps(params.model_dump(exclude_none=True), option=orjson.OPT_SORT_KEYS), sources
+
 
 class GeminiSearchProvider(BaseSearchProvider):
     """
@@ -30,6 +67,9 @@ class GeminiSearchProvider(BaseSearchProvider):
         super().__init__(api_key)
         self.client = genai.Client(api_key=api_key)
         self.model = "gemini-2.0-flash-exp"  # Latest model with grounding support
+        # Parameter extraction is a small structured task without grounding,
+        # so it runs on the faster, cheaper lite model
+        self.extract_model = "gemini-2.5-flash-lite"
 
     async def extract_parameters(self, query: str) -> PropertySearchParams:
         """
@@ -45,8 +85,18 @@ class GeminiSearchProvider(BaseSearchProvider):
             budget_max=7.0,
             keywords=["100ft road"]
         )
+
+        Repeated queries (same words, any case/spacing) are answered from
+        _PARAMS_CACHE without calling Gemini.
         """
 
+        cache_key = _params_cache_key(query)
+        cached = _PARAMS_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("Parameter cache hit: %s", cache_key)
+            # A copy, so a caller editing the params can't change the cache
+            return cached.model_copy(deep=True)
+
         extraction_prompt = f"""You are a property search parameter extractor for Bangalore, India.
 
 Extract structured search parameters from this query:
@@ -60,36 +110,29 @@ Apply these inference rules:
    - "lakhs" = multiply by 0.01 crores
    - "crores" = use as is
    - "4-7 crores" → budget_min=4, budget_max=7
-5. Extract additional keywords (like "100ft road", "near metro", etc.)
-
-Return ONLY valid JSON matching this exact schema:
-{{
-    "property_type": "3BHK" or null,
-    "category": "residential" or "commercial",
-    "location": "Indiranagar" or null,
-    "budget_min": 4.0 or null,
-    "budget_max": 7.0 or null,
-    "keywords": ["100ft road"] or [],
-    "city": "Bangalore"
-}}
-
-JSON output:"""
+5. Extract additional keywords (like "100ft road", "near metro", etc.)"""
 
         try:
+            # Structured output: Gemini returns JSON matching PropertySearchParams
+            # (no fence stripping, and the schema isn't repeated in the prompt)
             response = self.client.models.generate_content(
-                model=self.model,
-                contents=extraction_prompt
+                model=self.extract_model,
+                contents=extraction_prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    response_schema=PropertySearchParams
+                )
             )
 
-            # Parse JSON from response
-            json_text = response.text.strip()
-            if json_text.startswith("```json"):
-                json_text = json_text[7:-3].strip()
-            elif json_text.startswith("```"):
-                json_text = json_text[3:-3].strip()
+            # google-genai validates the JSON into the model; fall back to the
+            # raw text if it couldn't (response.parsed is None then)
+            params = response.parsed
+            if not isinstance(params, PropertySearchParams):
+                params = PropertySearchParams.model_validate_json(response.text)
 
-            params_dict = json.loads(json_text)
-            return PropertySearchParams(**params_dict)
+            # Only successful extractions are cached, never the fallback below
+            _PARAMS_CACHE[cache_key] = params
+            return params.model_copy(deep=True)
 
         except Exception as e:
             print(f"⚠️ Parameter extraction failed: {e}")
@@ -116,23 +159,15 @@ JSON output:"""
         """
         query_parts = []
 
-        # Add site: operator based on source
-        site_map = {
-            "magicbricks": "magicbricks.com",
-            "housing": "housing.com",
-            "99acres": "99acres.com",
-            "nobroker": "nobroker.com",
-            "commonfloor": "commonfloor.com",
-            "squareyards": "squareyards.com"
-        }
-
         # Handle multiple sources with OR operator
         if source:
-            source_list = [s.strip() for s in source.split(',') if s.strip()]
+            # Normalized like _search_cache_key, so "MagicBricks" == "magicbricks"
+            source_list = [s.strip().lower() for s in source.split(',') if s.strip()]
             site_queries = []
             for src in source_list:
-                if src in site_map:
-                    site_queries.append(f"site:{site_map[src]}")
+                site = _SITE_MAP.get(src)
+                if site:
+                    site_queries.append(f"site:{site}")
 
             if site_queries:
                 # Combine multiple sites with OR operator
@@ -180,8 +215,16 @@ JSON output:"""
         1. Builds optimized search query from parameters (with site: operator)
         2. Uses Gemini's grounding tool to search Google in real-time
         3. Extracts property results from grounded response
+
+        Results are cached in _SEARCH_CACHE per (params, source).
         """
 
+        cache_key = _search_cache_key(params, source)
+        cached = _SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("Search cache hit (%d results)", len(cached))
+            return [result.model_copy() for result in cached]
+
         search_query = self._build_search_query(params, source)
         print(f"🔍 Search query with operators: {search_query}")
 
@@ -216,6 +259,10 @@ Format as a list of properties.""",
             results = self._parse_property_results(response, sources, params)
             print(f"🏠 Found {len(results)} properties")
 
+            # An empty list may be a parse failure; let the next search retry
+            if results:
+                _SEARCH_CACHE[cache_key] = results
+                return [result.model_copy() for result in results]
             return results
 
         except Exception as e:
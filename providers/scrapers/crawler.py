@@ -0,0 +1,179 @@
+"""
+Shared Crawl4AI crawler
+=======================
+
+One headless browser for every scrape, started on first use.
+
+Entering AsyncWebCrawler launches a Playwright browser (hundreds of ms to
+seconds); with a shared crawler that cost is paid once per process and
+each scrape only opens a page. The app closes it on shutdown (see the
+lifespan in app_factory.py).
+
+BaseCrawlScraper holds the crawl plumbing shared by the site scrapers
+(schema -> extraction strategy, single and batched scrapes).
+"""
+
+import asyncio
+import orjson
+from typing import Any, Dict, List, Optional
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, JsonCssExtractionStrategy
+
+
+_crawler: Optional[AsyncWebCrawler] = None
+
+# Concurrent first scrapes must not each launch a browser
+_lock = asyncio.Lock()
+
+
+async def get_crawler() -> AsyncWebCrawler:
+    """
+    Return the shared crawler, starting the browser on first call.
+
+    Example:
+        >>> crawler = await get_crawler()
+        >>> result = await crawler.arun(url, config=config)
+    """
+    global _crawler
+
+    if _crawler is None:
+        async with _lock:
+            if _crawler is None:
+                crawler = AsyncWebCrawler(config=BrowserConfig(
+                    headless=True,
+                    verbose=False
+                ))
+                await crawler.start()
+                _crawler = crawler
+
+    return _crawler
+
+
+async def close_crawler() -> None:
+    """Close the shared browser, if one was started."""
+    global _crawler
+
+    async with _lock:
+        if _crawler is not None:
+            crawler, _crawler = _crawler, None
+            await crawler.close()
+
+
+class BaseCrawlScraper:
+    """
+    Base class for the schema-based scrapers (MagicBricks, SquareYards)
+
+    Subclasses set NAME (the log prefix) and implement:
+    - _load_or_generate_schema(): fill self.schema
+    - _parse_data(data): extracted JSON -> list of property dicts
+    """
+
+    NAME = "Scraper"
+
+    # Max pages loading at once in scrape_many
+    MAX_CONCURRENT_PAGES = 8
+
+    def __init__(self):
+        """Initialize scraper"""
+        self.schema = None
+        self._strategy = None
+
+    async def _load_or_generate_schema(self):
+        raise NotImplementedError
+
+    def _parse_data(self, data: Any) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def _prepare(self):
+        """Load the schema (if needed) and build the extraction strategy once"""
+        # Load or generate schema
+        if not self.schema:
+            print(f"[{self.NAME}] Schema not loaded, loading/generating...")
+            await self._load_or_generate_schema()
+        else:
+            print(f"[{self.NAME}] Using cached schema")
+
+        # Create extraction strategy (reused by every later scrape)
+        if self._strategy is None:
+            self._strategy = JsonCssExtractionStrategy(self.schema)
+            print(f"[{self.NAME}] Created extraction strategy")
+
+    def _parse_result(self, result) -> List[Dict[str, Any]]:
+        """Turn one crawl result into a list of property dicts (raises if it failed)"""
+        if not result.success:
+            error_msg = getattr(result, 'error_message', 'Unknown error')
+            print(f"[{self.NAME}] Extraction failed: {error_msg}")
+            raise Exception(f"Scraping failed: {error_msg}")
+
+        print(f"[{self.NAME}] Extraction successful!")
+        print(f"[{self.NAME}] Raw extracted content: {result.extracted_content[:500]}...")
+        data = orjson.loads(result.extracted_content)
+        print(f"[{self.NAME}] Parsed data type: {type(data)}")
+        return self._parse_data(data)
+
+    async def scrape(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Scrape properties from one URL (can return multiple properties for search results)
+
+        Args:
+            url: Property URL or search results URL
+
+        Returns:
+            List of property dictionaries (raw data from schema)
+        """
+        print(f"[{self.NAME}] Starting scrape for: {url}")
+
+        await self._prepare()
+
+        # Scrape the page
+        print(f"[{self.NAME}] Getting crawler...")
+        # Shared browser: launched once per process, not per scrape
+        crawler = await get_crawler()
+        config = CrawlerRunConfig(extraction_strategy=self._strategy)
+        results = await crawler.arun(url, config=config)
+        print(f"[{self.NAME}] Crawler returned {len(results)} results")
+
+        for result in results:
+            return self._parse_result(result)
+
+        raise Exception("No results from crawler")
+
+    async def scrape_many(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape several URLs concurrently with one arun_many call
+
+        Up to MAX_CONCURRENT_PAGES pages load at once in the shared browser.
+        URLs that fail are logged and skipped.
+
+        Args:
+            urls: Property or search results URLs
+
+        Returns:
+            Property dictionaries from all successful URLs, in URL order
+        """
+        print(f"[{self.NAME}] Starting scrape for {len(urls)} URLs")
+
+        await self._prepare()
+
+        crawler = await get_crawler()
+        config = CrawlerRunConfig(
+            extraction_strategy=self._strategy,
+            semaphore_count=self.MAX_CONCURRENT_PAGES
+        )
+        results = await crawler.arun_many(urls, config=config)
+
+        # arun_many yields results as pages finish; put them back in URL order
+        position = {url: i for i, url in enumerate(urls)}
+        results = sorted(results, key=lambda result: position.get(result.url, len(urls)))
+
+        properties = []
+        for result in results:
+            try:
+                properties.extend(self._parse_result(result))
+            except Exception as e:
+                print(f"[{self.NAME}] Skipping {result.url}: {e}")
+
+        print(f"[{self.NAME}] Scraped {len(properties)} properties from {len(urls)} URLs")
+        return properties
+
+
+__all__ = ["get_crawler", "close_crawler", "BaseCrawlScraper"]
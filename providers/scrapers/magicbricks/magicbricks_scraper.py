@@ -2,28 +2,26 @@
 MagicBricks property scraper using Crawl4AI
 """
 import os
-import json
+import orjson
 from pathlib import Path
 from typing import List, Dict, Any
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, BrowserConfig
 from crawl4ai import JsonCssExtractionStrategy , JsonXPathExtractionStrategy, LLMConfig
  
+from ..crawler import BaseCrawlScraper
 from dotenv import load_dotenv, find_dotenv
 
 load_dotenv(find_dotenv(filename=".env"))
 
 
-class MagicBricksScraper:
+class MagicBricksScraper(BaseCrawlScraper):
     """MagicBricks property scraper"""
 
+    NAME = "MagicBricks"
+
     SCHEMA_PATH = Path(__file__).parent / "schemas" / "schema.json"
     SAMPLE_HTML_PATH = Path(__file__).parent / "sample_html" / "magicbricks_residential_sale_sample.html"
     SCHEMA_PROMPT_PATH = Path(__file__).parent / "prompts" / "schema_generation_prompt.txt"
 
-    def __init__(self):
-        """Initialize scraper"""
-        self.schema = None
-
     def _post_process_properties(self, properties: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Post-process extracted properties to parse JSON-LD and extract URLs
@@ -39,7 +37,7 @@ class MagicBricksScraper:
             if "property_url" in prop and isinstance(prop["property_url"], str):
                 try:
                     # Try to parse the JSON-LD
-                    json_ld = json.loads(prop["property_url"])
+                    json_ld = orjson.loads(prop["property_url"])
                     # Extract the URL from the JSON-LD
                     if isinstance(json_ld, dict) and "url" in json_ld:
                         prop["property_url"] = json_ld["url"]
@@ -51,7 +49,7 @@ class MagicBricksScraper:
                     if isinstance(json_ld, dict) and "numberOfRooms" in json_ld:
                         prop["bedrooms"] = json_ld["numberOfRooms"]
                         print(f"[MagicBricks] Extracted bedrooms from JSON-LD: {prop['bedrooms'][:80]}...")
-                except (json.JSONDecodeError, KeyError) as e:
+                except (orjson.JSONDecodeError, KeyError) as e:
                     # If parsing fails, leave property_url as is
                     print(f"[MagicBricks] Warning: Could not parse JSON-LD for property_url: {str(e)[:100]}")
 
@@ -62,8 +60,8 @@ class MagicBricksScraper:
         # Try to load existing schema
         if self.SCHEMA_PATH.exists():
             print("[MagicBricks] Using existing schema")
-            with open(self.SCHEMA_PATH, 'r') as f:
-                self.schema = json.load(f)
+            with open(self.SCHEMA_PATH, 'rb') as f:
+                self.schema = orjson.loads(f.read())
             return
 
         # Generate schema (first time only)
@@ -105,72 +103,28 @@ class MagicBricksScraper:
         # )
         # Save schema
         self.SCHEMA_PATH.parent.mkdir(exist_ok=True)
-        with open(self.SCHEMA_PATH, 'w') as f:
-            json.dump(self.schema, f, indent=2)
+        with open(self.SCHEMA_PATH, 'wb') as f:
+            f.write(orjson.dumps(self.schema, option=orjson.OPT_INDENT_2))
         print(f"[MagicBricks] Schema saved to {self.SCHEMA_PATH}")
         print("[MagicBricks] Generated Schema:")
-        print(json.dumps(self.schema, indent=2))
-
-    async def scrape(self, url: str) -> List[Dict[str, Any]]:
-        """
-        Scrape properties from MagicBricks URL (can return multiple properties for search results)
-
-        Args:
-            url: MagicBricks property URL or search results URL
-
-        Returns:
-            List of property dictionaries (raw data from schema)
-        """
-        print(f"[MagicBricks] Starting scrape for: {url}")
-
-        # Load or generate schema
-        if not self.schema:
-            print("[MagicBricks] Schema not loaded, loading/generating...")
-            await self._load_or_generate_schema()
+        print(orjson.dumps(self.schema, option=orjson.OPT_INDENT_2).decode())
+
+    def _parse_data(self, data: Any) -> List[Dict[str, Any]]:
+        """Turn the extracted JSON into a list of property dicts"""
+        # Handle different response formats
+        if isinstance(data, dict) and "property_data_array" in data:
+            # Response wrapped in object
+            properties = data["property_data_array"]
+            print(f"[MagicBricks] Data is dict with property_data_array containing {len(properties)} items")
+            properties = self._post_process_properties(properties)
+            return properties
+        elif isinstance(data, list):
+            # Direct array response
+            print(f"[MagicBricks] Data is list with {len(data)} items")
+            data = self._post_process_properties(data)
+            return data
         else:
-            print("[MagicBricks] Using cached schema")
-
-        # Create extraction strategy
-        extraction_strategy = JsonCssExtractionStrategy(self.schema)
-        print("[MagicBricks] Created extraction strategy")
-
-        # Scrape the page
-        print("[MagicBricks] Starting crawler...")
-        async with AsyncWebCrawler(config=BrowserConfig(
-            headless=True,
-            verbose=False
-        )) as crawler:
-            config = CrawlerRunConfig(extraction_strategy=extraction_strategy)
-            results = await crawler.arun(url, config=config)
-            print(f"[MagicBricks] Crawler returned {len(results)} results")
-
-            for result in results:
-                if result.success:
-                    print("[MagicBricks] Extraction successful!")
-                    print(f"[MagicBricks] Raw extracted content: {result.extracted_content[:500]}...")
-                    data = json.loads(result.extracted_content)
-                    print(f"[MagicBricks] Parsed data type: {type(data)}")
-
-                    # Handle different response formats
-                    if isinstance(data, dict) and "property_data_array" in data:
-                        # Response wrapped in object
-                        properties = data["property_data_array"]
-                        print(f"[MagicBricks] Data is dict with property_data_array containing {len(properties)} items")
-                        properties = self._post_process_properties(properties)
-                        return properties
-                    elif isinstance(data, list):
-                        # Direct array response
-                        print(f"[MagicBricks] Data is list with {len(data)} items")
-                        data = self._post_process_properties(data)
-                        return data
-                    else:
-                        # Single property
-                        print("[MagicBricks] Data is single property object")
-                        data = self._post_process_properties([data])
-                        return data
-                else:
-                    error_msg = getattr(result, 'error_message', 'Unknown error')
-                    print(f"[MagicBricks] Extraction failed: {error_msg}")
-                    raise Exception(f"Scraping failed: {error_msg}")
-
-        raise Exception("No results from crawler")
+            # Single property
+            print("[MagicBricks] Data is single property object")
+            data = self._post_process_properties([data])
+            return data
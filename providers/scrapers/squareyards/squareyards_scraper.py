@@ -2,36 +2,34 @@
 Simple SquareYards property scraper using Crawl4AI
 """
 import os
-import json
+import orjson
 import re
 from pathlib import Path
 from typing import Tuple, Dict, Any, List
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, BrowserConfig
 from crawl4ai import JsonCssExtractionStrategy, LLMConfig
 from models.scraping import PropertyDetails, PropertyAgent
+from ..crawler import BaseCrawlScraper
 from dotenv import load_dotenv, find_dotenv
 
 load_dotenv(find_dotenv(filename=".env"))
 
 
-class SquareYardsScraper:
+class SquareYardsScraper(BaseCrawlScraper):
     """Simple SquareYards scraper"""
 
+    NAME = "SquareYards"
+
     SCHEMA_PATH = Path(__file__).parent / "schemas" / "schema.json"
     SAMPLE_HTML_PATH = Path(__file__).parent / "sample_html" / "squareyards_sample.html"
     SCHEMA_PROMPT_PATH = Path(__file__).parent / "prompts" / "schema_generation_prompt.txt"
 
-    def __init__(self):
-        """Initialize scraper"""
-        self.schema = None
-
     async def _load_or_generate_schema(self):
         """Load existing schema or generate if not exists"""
         # Try to load existing schema
         if self.SCHEMA_PATH.exists():
             print("[SquareYards] Using existing schema")
-            with open(self.SCHEMA_PATH, 'r') as f:
-                self.schema = json.load(f)
+            with open(self.SCHEMA_PATH, 'rb') as f:
+                self.schema = orjson.loads(f.read())
             return
 
         # Generate schema (first time only)
@@ -66,65 +64,22 @@ class SquareYardsScraper:
 
         # Save schema
         self.SCHEMA_PATH.parent.mkdir(exist_ok=True)
-        with open(self.SCHEMA_PATH, 'w') as f:
-            json.dump(self.schema, f, indent=2)
+        with open(self.SCHEMA_PATH, 'wb') as f:
+            f.write(orjson.dumps(self.schema, option=orjson.OPT_INDENT_2))
         print(f"[SquareYards] Schema saved to {self.SCHEMA_PATH}")
         print("[SquareYards] Generated Schema:")
-        print(json.dumps(self.schema, indent=2))
-
-    async def scrape(self, url: str) -> List[Tuple[PropertyDetails, PropertyAgent]]:
-        """
-        Scrape properties from SquareYards URL (can return multiple properties for search results)
-
-        Args:
-            url: SquareYards property URL or search results URL
-
-        Returns:
-            List of Tuples of (PropertyDetails, PropertyAgent)
-        """
-        print(f"[SquareYards] Starting scrape for: {url}")
-
-        # Load or generate schema
-        if not self.schema:
-            print("[SquareYards] Schema not loaded, loading/generating...")
-            await self._load_or_generate_schema()
+        print(orjson.dumps(self.schema, option=orjson.OPT_INDENT_2).decode())
+
+    def _parse_data(self, data: Any) -> List[Dict[str, Any]]:
+        """Turn the extracted JSON into a list of property dicts"""
+        if isinstance(data, list):
+            print(f"[SquareYards] Data is list with {len(data)} items")
+            print(f"[SquareYARDS] Data: {orjson.dumps(data[0], option=orjson.OPT_INDENT_2).decode()}")
+            # Return data as-is for now - schema already parsed it correctly
+            return data
         else:
-            print("[SquareYards] Using cached schema")
-
-        # Create extraction strategy
-        extraction_strategy = JsonCssExtractionStrategy(self.schema)
-        print("[SquareYards] Created extraction strategy")
-
-        # Scrape the page
-        print("[SquareYards] Starting crawler...")
-        async with AsyncWebCrawler(config=BrowserConfig(
-            headless=True,
-            verbose=False
-        )) as crawler:
-            config = CrawlerRunConfig(extraction_strategy=extraction_strategy)
-            results = await crawler.arun(url, config=config)
-            print(f"[SquareYards] Crawler returned {len(results)} results")
-
-            for result in results:
-                if result.success:
-                    print("[SquareYards] Extraction successful!")
-                    print(f"[SquareYards] Raw extracted content: {result.extracted_content[:500]}...")
-                    data = json.loads(result.extracted_content)
-                    print(f"[SquareYards] Parsed data type: {type(data)}")
-                    if isinstance(data, list):
-                        print(f"[SquareYards] Data is list with {len(data)} items")
-                        print(f"[SquareYARDS] Data: {json.dumps(data[0], indent=2)}")
-                        # Return data as-is for now - schema already parsed it correctly
-                        return data
-                    else:
-                        # Single property
-                        return [data]
-                else:
-                    error_msg = getattr(result, 'error_message', 'Unknown error')
-                    print(f"[SquareYards] Extraction failed: {error_msg}")
-                    raise Exception(f"Scraping failed: {error_msg}")
-
-        raise Exception("No results from crawler")
+            # Single property
+            return [data]
 
     # COMMENTED OUT - Schema already returns data in correct format
     # def _parse_all_properties(self, data: List[Dict[str, Any]], url: str) -> List[Tuple[PropertyDetails, PropertyAgent]]:
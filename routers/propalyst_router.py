@@ -6,7 +6,15 @@ API endpoints for Propalyst conversational Q&A functionality.
 """
 
 import os
-from fastapi import APIRouter, HTTPException
+import asyncio
+import logging
+import functools
+import operator
+import orjson
+from typing import Any, Dict, List, Optional, Tuple
+from cachetools import LRUCache
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
@@ -18,16 +26,155 @@ from models.propalyst import (
     PropalystAreasRequest,
     PropalystAreasResponse
 )
-from agent.graph import create_propalyst_graph
-from agent.nodes.propalyst_qa import process_user_answer
+from agent.nodes.propalyst_qa import (
+    process_user_answer,
+    process_user_answers,
+    extract_multi_field,
+    component_json
+)
+from agent.batching import LLMBatcher
 from sessions import get_session, update_session
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/api/propalyst",
     tags=["Propalyst"]
 )
 
 
+# ============================================================================
+# SUMMARY LLM
+# ============================================================================
+
+# Static instructions: byte-identical on every call and always the first
+# message, so the provider's prompt cache can reuse the prefix. Only the
+# short user message with the five answers varies (see propalyst_summary).
+SUMMARY_SYSTEM_PROMPT = """You are a friendly real estate assistant helping users find their perfect home.
+
+Generate a friendly, detailed summary that introduces the AREAS we're recommending based on the user's requirements (given in the next message).
+
+Generate a 2-3 sentence summary that:
+1. Briefly acknowledges their key requirements (work location, family needs, budget, commute)
+2. Explicitly states "Here are the areas we suggest based on your requirements" or similar phrasing
+3. Sounds warm and personalized
+
+Important: Emphasize that these are AREA recommendations, not individual properties. The summary should introduce the areas shown below.
+
+Do not use bullet points. Write in paragraph form. Be conversational and friendly."""
+
+# Routes every summary request to the same prompt cache on OpenAI's side;
+# bump the version whenever SUMMARY_SYSTEM_PROMPT changes
+SUMMARY_PROMPT_CACHE_KEY = "propalyst_summary_v1"
+
+# The per-request user message; only these slots change between requests
+SUMMARY_PREFERENCES_TEMPLATE = """User's preferences:
+- Work Location: {work_location}
+- Has Kids: {has_kids}
+- Maximum Commute Time: {commute_time_max} minutes
+- Property Type: {property_type}
+- Maximum Budget: ₹{budget_max:,}"""
+
+# Built once; every summary request starts with this same message object
+_SUMMARY_SYSTEM_MESSAGE = SystemMessage(content=SUMMARY_SYSTEM_PROMPT)
+
+
+# The summary is 2-3 sentences (~60-90 tokens), so cap decoding a little
+# above that and stop at the first blank line instead of letting the model
+# run on. Decode time is linear in output tokens.
+SUMMARY_MAX_TOKENS = 120
+SUMMARY_STOP = ["\n\n"]
+
+# Fail fast on a stalled request instead of holding the endpoint open
+SUMMARY_TIMEOUT = 20  # Seconds per attempt
+SUMMARY_MAX_RETRIES = 2
+
+
+@functools.lru_cache(maxsize=1)
+def get_summary_llm() -> ChatOpenAI:
+    """
+    Return the LLM used for conversation summaries (created once).
+
+    Reused across requests so its HTTP connection pool stays warm.
+    Use get_summary_llm.cache_clear() to pick up changed environment variables.
+
+    Uses environment variables:
+    - OPENAI_API_KEY: Your OpenAI API key
+    - LLM_MODEL: Model name (default: gpt-4o-mini)
+    - SUMMARY_BACKEND_URL: Optional OpenAI-compatible endpoint (e.g. a
+      self-hosted vLLM server) to send summaries to instead of OpenAI
+    - SUMMARY_MODEL: Model name on that backend (default: LLM_MODEL)
+
+    Raises:
+        ValueError: If OPENAI_API_KEY is not set and no SUMMARY_BACKEND_URL is given
+    """
+    backend_url = os.getenv("SUMMARY_BACKEND_URL")
+    model = os.getenv("LLM_MODEL", "gpt-4o-mini")
+
+    if backend_url:
+        # Self-hosted servers usually don't check the key, but the client needs one
+        return ChatOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY") or "EMPTY",
+            base_url=backend_url,
+            model=os.getenv("SUMMARY_MODEL", model),
+            temperature=0.7,
+            max_tokens=SUMMARY_MAX_TOKENS,
+            stop=SUMMARY_STOP,
+            timeout=SUMMARY_TIMEOUT,
+            max_retries=SUMMARY_MAX_RETRIES
+        )
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY not found")
+
+    return ChatOpenAI(
+        api_key=api_key,
+        model=model,
+        temperature=0.7,
+        max_tokens=SUMMARY_MAX_TOKENS,
+        stop=SUMMARY_STOP,
+        timeout=SUMMARY_TIMEOUT,
+        max_retries=SUMMARY_MAX_RETRIES,
+        extra_body={"prompt_cache_key": SUMMARY_PROMPT_CACHE_KEY}
+    )
+
+
+# Concurrent summary requests (e.g. a burst of users finishing Q5) are sent
+# together in one abatch() call
+SUMMARY_MAX_BATCH = 32     # Max summaries per abatch() call
+SUMMARY_BATCH_WINDOW = 0.02  # Seconds to wait for more requests to join
+_summary_batcher = LLMBatcher(get_summary_llm, max_batch=SUMMARY_MAX_BATCH, window=SUMMARY_BATCH_WINDOW)
+
+
+# ============================================================================
+# RESULT CACHES
+# ============================================================================
+
+# The summary prompt depends only on the five answers, so summaries are
+# cached on the answer tuple and shared across sessions. (Areas are kept on
+# the session once calculate_areas has run.)
+_SUMMARY_CACHE: LRUCache = LRUCache(maxsize=4096)
+
+ANSWER_FIELDS = ("work_location", "has_kids", "commute_time_max", "property_type", "budget_max")
+
+# state -> tuple of the five answers in one C call. Every session starts
+# from create_propalyst_state(), which sets all five keys (to None).
+_get_answers = operator.itemgetter(*ANSWER_FIELDS)
+
+
+def _answers_key(state: Dict[str, Any]) -> Optional[Tuple[Any, ...]]:
+    """
+    Return the five answers as a cache key, or None if any is still missing.
+
+    Values are used exactly as parsed (budget included): the summary quotes
+    the exact budget, so bucketing it could return a summary for a
+    different budget.
+    """
+    key = _get_answers(state)
+    return None if None in key else key
+
+
 @router.post("/chat", response_model=PropalystChatResponse)
 async def propalyst_chat(request: PropalystChatRequest):
     """
@@ -67,30 +214,47 @@ async def propalyst_chat(request: PropalystChatRequest):
         → Response: Q2 (kids)
 
         ... and so on for Q3, Q4, Q5
+
+        Free text (no field), e.g. "I work in Whitefield and have kids":
+        → One LLM call fills every answer it mentions
+        → Response: first question still unanswered
     """
 
-    print(f"\n💬 Propalyst Chat - Session: {request.session_id}")
+    logger.debug("Propalyst chat - session: %s", request.session_id)
 
     try:
-        # Import graph instance from graphs module
-        from graphs import propalyst_graph
+        # Get graph instance from graphs module (built once at startup)
+        from graphs import get_propalyst_graph
+        propalyst_graph = get_propalyst_graph()
 
         # Step 1: Get or create session state
         state = get_session(request.session_id)
 
         # Step 2: If user provided input, process it
-        if request.user_input and request.field:
-            print(f"   📝 Processing answer for field: {request.field}")
-            print(f"   💭 User input: {request.user_input}")
+        if request.answers:
+            # Bulk fill: validate all answers concurrently
+            logger.debug("Processing %d answers", len(request.answers))
+            state = await process_user_answers(state, request.answers)
+
+        elif request.user_input and request.field:
+            logger.debug("Processing answer for field=%s: %s", request.field, request.user_input)
 
             # Parse and update state with user's answer
             state = await process_user_answer(state, request.field, request.user_input)
 
+        elif request.user_input:
+            # Free text without a field: pick up every answer it contains
+            logger.debug("Extracting all answers from: %s", request.user_input)
+            state = await extract_multi_field(state, request.user_input)
+
         # Step 3: Run graph to get next question or results
-        print("   🔄 Running Propalyst graph...")
+        logger.debug("Running Propalyst graph...")
         updated_state = await propalyst_graph.ainvoke(state)
 
         # Step 4: Save updated state
+        # Inline on purpose: it is a dict assignment (see sessions.py), cheaper
+        # than scheduling a task, and deferring it would let the user's next
+        # request read the session before this answer is saved
         update_session(request.session_id, updated_state)
 
         # Step 5: Extract component and message
@@ -99,36 +263,28 @@ async def propalyst_chat(request: PropalystChatRequest):
         current_step = updated_state.get("current_step", 1)
 
         # Step 6: Check if conversation is complete (all 5 questions answered)
-        completed = (
-            updated_state.get("work_location") is not None and
-            updated_state.get("has_kids") is not None and
-            updated_state.get("commute_time_max") is not None and
-            updated_state.get("property_type") is not None and
-            updated_state.get("budget_max") is not None
-        )
-
-        print(f"   ✅ Step {current_step}/5, Completed: {completed}")
-
-        # Step 7: Convert component to dict
-        component_dict = None
-        if component:
-            component_dict = {
-                "type": component.type,
-                "props": component.props
-            }
-
-        # Step 8: Return response
-        return PropalystChatResponse(
-            component=component_dict,
-            message=message,
-            session_id=request.session_id,
-            current_step=current_step,
-            completed=completed
+        get = updated_state.get
+        completed = all(get(field) is not None for field in ANSWER_FIELDS)
+
+        logger.debug("Step %s/5, completed: %s", current_step, completed)
+
+        # Step 7: Return response (same shape as PropalystChatResponse)
+        # The component's JSON is spliced in pre-serialized; the static
+        # question components never go through a Pydantic dump here
+        return Response(
+            orjson.dumps({
+                "component": orjson.Fragment(component_json(component)) if component else None,
+                "message": message,
+                "session_id": request.session_id,
+                "current_step": current_step,
+                "completed": completed
+            }),
+            media_type="application/json"
         )
 
     except Exception as e:
         error_message = f"Propalyst chat error: {str(e)}"
-        print(f"   ❌ {error_message}")
+        logger.error(error_message)
 
         raise HTTPException(
             status_code=500,
@@ -136,8 +292,26 @@ async def propalyst_chat(request: PropalystChatRequest):
         )
 
 
+def _summary_messages(state: Dict[str, Any]) -> List[Any]:
+    """
+    Build the summary prompt: static instructions first (cacheable prefix),
+    then only the user's answers.
+    """
+    work_location, has_kids, commute_time_max, property_type, budget_max = _get_answers(state)
+
+    preferences = SUMMARY_PREFERENCES_TEMPLATE.format(
+        work_location=work_location,
+        has_kids="Yes" if has_kids else "No",
+        commute_time_max=commute_time_max,
+        property_type=property_type,
+        budget_max=budget_max
+    )
+
+    return [_SUMMARY_SYSTEM_MESSAGE, HumanMessage(content=preferences)]
+
+
 @router.post("/summary", response_model=PropalystSummaryResponse)
-async def propalyst_summary(request: PropalystSummaryRequest):
+async def propalyst_summary(request: PropalystSummaryRequest, stream: bool = False):
     """
     Generate LLM-based conversation summary.
 
@@ -148,6 +322,9 @@ async def propalyst_summary(request: PropalystSummaryRequest):
 
     Args:
         request (PropalystSummaryRequest): Request with session_id
+        stream (bool): ?stream=true sends the summary as Server-Sent Events,
+            one "delta" event per token chunk as the LLM produces it, then
+            a "done" event with the full text
 
     Returns:
         PropalystSummaryResponse: LLM-generated summary
@@ -164,69 +341,78 @@ async def propalyst_summary(request: PropalystSummaryRequest):
             "summary": "Based on our conversation, you're looking for a Villa in Whitefield...",
             "session_id": "abc-123"
         }
-    """
-
-    print(f"\n📝 Generating summary for session: {request.session_id}")
-
-    try:
-        # Step 1: Get session state
-        state = get_session(request.session_id)
-
-        # Step 2: Extract collected data
-        work_location = state.get("work_location")
-        has_kids = state.get("has_kids")
-        commute_time_max = state.get("commute_time_max")
-        property_type = state.get("property_type")
-        budget_max = state.get("budget_max")
-
-        # Step 3: Generate summary using LLM
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY not found")
-
-        llm = ChatOpenAI(
-            api_key=api_key,
-            model=os.getenv("LLM_MODEL", "gpt-4o-mini"),
-            temperature=0.7
-        )
-
-        prompt = f"""You are a helpful real estate assistant. Generate a friendly, detailed summary that introduces the AREAS we're recommending based on the user's requirements.
 
-User's preferences:
-- Work Location: {work_location}
-- Has Kids: {"Yes" if has_kids else "No"}
-- Maximum Commute Time: {commute_time_max} minutes
-- Property Type: {property_type}
-- Maximum Budget: ₹{budget_max:,}
+        Streaming (POST /api/propalyst/summary?stream=true):
+        event: delta
+        data: {"delta": "Based on"}
 
-Generate a 2-3 sentence summary that:
-1. Briefly acknowledges their key requirements (work location, family needs, budget, commute)
-2. Explicitly states "Here are the areas we suggest based on your requirements" or similar phrasing
-3. Sounds warm and personalized
+        event: delta
+        data: {"delta": " our conversation"}
 
-Important: Emphasize that these are AREA recommendations, not individual properties. The summary should introduce the areas shown below.
-
-Do not use bullet points. Write in paragraph form. Be conversational and friendly."""
+        event: done
+        data: {"summary": "Based on our conversation, ...", "session_id": "abc-123"}
+    """
 
-        messages = [
-            SystemMessage(content="You are a friendly real estate assistant helping users find their perfect home."),
-            HumanMessage(content=prompt)
-        ]
+    logger.debug("Generating summary for session: %s", request.session_id)
+
+    # Step 1: Get session state
+    state = get_session(request.session_id)
+
+    # Same answers (from any session) and prompt version -> reuse the summary
+    answers = _answers_key(state)
+    cache_key = answers and (SUMMARY_PROMPT_CACHE_KEY, *answers)
+    cached = _SUMMARY_CACHE.get(cache_key) if cache_key else None
+    if cached is not None:
+        logger.debug("Summary cache hit")
+
+    if stream:
+        async def event_stream():
+            try:
+                if cached is not None:
+                    summary = cached
+                    yield b"event: delta\ndata: " + orjson.dumps({"delta": summary}) + b"\n\n"
+                else:
+                    # Streamed requests bypass the batcher: each needs its own token stream
+                    parts = []
+                    async for chunk in get_summary_llm().astream(_summary_messages(state)):
+                        if chunk.content:
+                            parts.append(chunk.content)
+                            yield b"event: delta\ndata: " + orjson.dumps({"delta": chunk.content}) + b"\n\n"
+                    summary = "".join(parts).strip()
+                    if cache_key:
+                        _SUMMARY_CACHE[cache_key] = summary
+                yield b"event: done\ndata: " + orjson.dumps(
+                    {"summary": summary, "session_id": request.session_id}
+                ) + b"\n\n"
+            except Exception as e:
+                logger.error("Summary generation error: %s", e)
+                yield b"event: error\ndata: " + orjson.dumps(f"Summary generation error: {str(e)}") + b"\n\n"
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+    if cached is not None:
+        return PropalystSummaryResponse.model_construct(
+            summary=cached,
+            session_id=request.session_id
+        )
 
-        print("   🤖 Generating summary with LLM...")
-        response = await llm.ainvoke(messages)
-        summary = response.content.strip()
+    try:
+        # Step 2: Generate summary using LLM
+        logger.debug("Generating summary with LLM...")
+        summary = (await _summary_batcher.submit(_summary_messages(state))).strip()
+        if cache_key:
+            _SUMMARY_CACHE[cache_key] = summary
 
-        print(f"   ✅ Summary generated: {summary[:100]}...")
+        logger.debug("Summary generated: %.100s", summary)
 
-        return PropalystSummaryResponse(
+        return PropalystSummaryResponse.model_construct(
             summary=summary,
             session_id=request.session_id
         )
 
     except Exception as e:
         error_message = f"Summary generation error: {str(e)}"
-        print(f"   ❌ {error_message}")
+        logger.error(error_message)
 
         raise HTTPException(
             status_code=500,
@@ -234,8 +420,38 @@ Do not use bullet points. Write in paragraph form. Be conversational and friendl
         )
 
 
+async def _get_recommended_areas(session_id: str) -> List[Dict[str, Any]]:
+    """
+    Return the session's recommended areas, running calculate_areas if needed.
+    """
+    # Get graph instance from graphs module (built once at startup)
+    from graphs import get_propalyst_graph
+    propalyst_graph = get_propalyst_graph()
+
+    # Step 1: Get session state
+    state = get_session(session_id)
+
+    # Step 2: Check if areas already calculated
+    if not state.get("calculated"):
+        logger.debug("Areas not yet calculated, triggering calculate_areas node...")
+
+        # Run graph to trigger calculate_areas node
+        updated_state = await propalyst_graph.ainvoke(state)
+
+        # Save updated state
+        update_session(session_id, updated_state)
+        state = updated_state
+
+    # Step 3: Extract recommended areas
+    return state.get("recommended_areas") or []
+
+
 @router.post("/areas", response_model=PropalystAreasResponse)
-async def propalyst_areas(request: PropalystAreasRequest):
+async def propalyst_areas(
+    request: PropalystAreasRequest,
+    stream: bool = False,
+    debug_delay: Optional[float] = None
+):
     """
     Get recommended areas for a completed session.
 
@@ -246,6 +462,11 @@ async def propalyst_areas(request: PropalystAreasRequest):
 
     Args:
         request (PropalystAreasRequest): Request with session_id
+        stream (bool): ?stream=true sends Server-Sent Events instead:
+            a "loading" event right away, then the "areas" payload
+        debug_delay (float): ?debug_delay=3 waits that many seconds first,
+            for testing the frontend skeleton loader. Only honoured when
+            ENV=dev; ignored everywhere else.
 
     Returns:
         PropalystAreasResponse: List of recommended areas
@@ -269,48 +490,53 @@ async def propalyst_areas(request: PropalystAreasRequest):
             ],
             "session_id": "abc-123"
         }
-    """
 
-    print(f"\n🏘️  Fetching areas for session: {request.session_id}")
+        Streaming (POST /api/propalyst/areas?stream=true):
+        event: loading
+        data: {"status": "loading"}
 
-    # Add delay to test skeleton loader (3 seconds)
-    import asyncio
-    await asyncio.sleep(3)
+        event: areas
+        data: {"areas": [...], "session_id": "abc-123"}
+    """
 
-    try:
-        # Import graph instance from graphs module
-        from graphs import propalyst_graph
+    logger.debug("Fetching areas for session: %s", request.session_id)
 
-        # Step 1: Get session state
-        state = get_session(request.session_id)
+    delay = debug_delay if debug_delay and os.getenv("ENV") == "dev" else 0
 
-        # Step 2: Check if areas already calculated
-        if not state.get("calculated"):
-            print("   ⚠️  Areas not yet calculated, triggering calculate_areas node...")
+    if stream:
+        async def event_stream():
+            yield b'event: loading\ndata: {"status":"loading"}\n\n'
+            try:
+                if delay:
+                    await asyncio.sleep(delay)
+                areas = await _get_recommended_areas(request.session_id)
+                yield b"event: areas\ndata: " + orjson.dumps(
+                    {"areas": areas, "session_id": request.session_id}
+                ) + b"\n\n"
+            except Exception as e:
+                logger.error("Areas fetch error: %s", e)
+                yield b"event: error\ndata: " + orjson.dumps(f"Areas fetch error: {str(e)}") + b"\n\n"
 
-            # Run graph to trigger calculate_areas node
-            updated_state = await propalyst_graph.ainvoke(state)
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
 
-            # Save updated state
-            update_session(request.session_id, updated_state)
-            state = updated_state
+    try:
+        if delay:
+            await asyncio.sleep(delay)
 
-        # Step 3: Extract recommended areas
-        recommended_areas = state.get("recommended_areas", [])
+        recommended_areas = await _get_recommended_areas(request.session_id)
 
-        print(f"   ✅ Returning {len(recommended_areas)} recommended areas")
+        logger.debug("Returning %d recommended areas", len(recommended_areas))
 
-        return PropalystAreasResponse(
+        return PropalystAreasResponse.model_construct(
             areas=recommended_areas,
             session_id=request.session_id
         )
 
     except Exception as e:
         error_message = f"Areas fetch error: {str(e)}"
-        print(f"   ❌ {error_message}")
+        logger.error(error_message)
 
         raise HTTPException(
             status_code=500,
             detail=error_message
         )
-
@@ -5,10 +5,20 @@ UI Generation Router
 API endpoints for UI component generation functionality.
 """
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import hashlib
+import logging
+import orjson
+from typing import Any, Dict
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
 from models.ui import GenerateUIRequest, GenerateUIResponse, UIComponentResponse
-from agent import AgentState
+from agent import create_initial_state
+from agent.nodes.ui_extractor import stream_ui_component
+from agent.state import COMPONENT_SCHEMAS
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api",
@@ -16,6 +26,36 @@ router = APIRouter(
 )
 
 
+# Normalized user_input -> graph run in progress. Identical requests that
+# arrive while one is running await the same task instead of starting a
+# second graph run (finished results are cached in the UI extractor node).
+_inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
+
+
+async def _run_ui_graph(user_input: str) -> Dict[str, Any]:
+    """
+    Run the UI generator graph, coalescing concurrent identical requests.
+
+    asyncio.shield keeps one caller's disconnect from cancelling the run
+    the other callers are waiting on.
+    """
+    from graphs import get_ui_generator_graph
+
+    key = " ".join(user_input.lower().split())
+    task = _inflight.get(key)
+
+    if task is None:
+        task = asyncio.ensure_future(
+            get_ui_generator_graph().ainvoke(create_initial_state(user_input))
+        )
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.debug("Joining in-flight request: %s", key)
+
+    return await asyncio.shield(task)
+
+
 @router.post("/generate-ui", response_model=GenerateUIResponse)
 async def generate_ui(request: GenerateUIRequest):
     """
@@ -53,51 +93,45 @@ async def generate_ui(request: GenerateUIRequest):
         }
     """
 
-    print(f"\n📥 Received request: {request.user_input}")
+    logger.debug("Received request: %s", request.user_input)
 
     try:
-        # Import graph instance from graphs module
-        from graphs import ui_generator_graph
-
-        # Step 1: Create initial state
-        initial_state = AgentState(
-            user_input=request.user_input,
-            component=None,
-            message="",
-            error=None
-        )
-
-        # Step 2: Run the LangGraph workflow
-        print("🔄 Running LangGraph workflow...")
-        final_state = await ui_generator_graph.ainvoke(initial_state)
-
-        # Step 3: Check for errors
-        if final_state.get("error"):
-            print(f"❌ Workflow error: {final_state['error']}")
+        # Steps 1-2: Create initial state and run the LangGraph workflow
+        # (shared with any identical request already running)
+        logger.debug("Running LangGraph workflow...")
+        final_state = await _run_ui_graph(request.user_input)
+
+        # Step 3: Read the outputs once
+        get = final_state.get
+        error, component = get("error"), get("component")
+        message = get("message") or "Component generated successfully"
+
+        # Step 4: Check for errors
+        if error:
+            logger.warning("Workflow error: %s", error)
             raise HTTPException(
                 status_code=400,
-                detail=final_state["error"]
+                detail=error
             )
 
-        # Step 4: Extract component from state
-        component = final_state.get("component")
-
         if not component:
-            print("❌ No component generated")
+            logger.warning("No component generated")
             raise HTTPException(
                 status_code=500,
                 detail="Failed to generate component"
             )
 
-        print(f"✅ Generated component: {component.type}")
+        logger.debug("Generated component: %s", component.type)
 
         # Step 5: Return response
-        return GenerateUIResponse(
-            component=UIComponentResponse(
+        # model_construct: the component was already validated as a
+        # UIComponent, so skip a second pass through pydantic-core
+        return GenerateUIResponse.model_construct(
+            component=UIComponentResponse.model_construct(
                 type=component.type,
                 props=component.props
             ),
-            message=final_state.get("message", "Component generated successfully"),
+            message=message,
             success=True
         )
 
@@ -108,7 +142,7 @@ async def generate_ui(request: GenerateUIRequest):
     except Exception as e:
         # Catch any unexpected errors
         error_message = f"Internal error: {str(e)}"
-        print(f"❌ {error_message}")
+        logger.error(error_message)
 
         raise HTTPException(
             status_code=500,
@@ -116,12 +150,57 @@ async def generate_ui(request: GenerateUIRequest):
         )
 
 
+@router.post("/generate-ui/stream")
+async def generate_ui_stream(request: GenerateUIRequest):
+    """
+    Generate a UI component, streaming the LLM output as Server-Sent Events.
+
+    Same input as /generate-ui, but the response starts as soon as the
+    model produces its first token instead of after the full completion.
+
+    Events (each data payload is JSON):
+        event: token      data: "<text chunk>"
+        event: component  data: {"type": "...", "props": {...}}
+        event: error      data: "<error message>"
+
+    Example:
+        POST /api/generate-ui/stream
+        {"user_input": "big red button"}
+
+        event: token
+        data: "{\"type\": \"Button\""
+
+        event: component
+        data: {"type": "Button", "props": {"label": "Click Me"}}
+    """
+
+    logger.debug("Received streaming request: %s", request.user_input)
+
+    async def event_stream():
+        async for event in stream_ui_component(request.user_input):
+            yield b"event: " + event["event"].encode() + b"\ndata: " + orjson.dumps(event["data"]) + b"\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+# COMPONENT_SCHEMAS is read-only, so the /components body is serialized once
+# and clients can revalidate it with If-None-Match instead of refetching
+_COMPONENTS_BYTES = orjson.dumps({
+    "components": list(COMPONENT_SCHEMAS.keys()),
+    "schemas": dict(COMPONENT_SCHEMAS)  # read-only proxy -> plain dict for JSON
+})
+_COMPONENTS_ETAG = '"' + hashlib.md5(_COMPONENTS_BYTES, usedforsecurity=False).hexdigest() + '"'
+_COMPONENTS_HEADERS = {"etag": _COMPONENTS_ETAG, "cache-control": "public, max-age=3600"}
+
+
 @router.get("/components")
-async def list_components():
+async def list_components(request: Request):
     """
     List available component types.
 
     This is helpful for frontend to know what components are supported.
+    The body never changes at runtime: it is sent with an ETag, and a
+    request whose If-None-Match matches gets an empty 304 instead.
 
     Returns:
         dict: List of available components with their schemas
@@ -132,10 +211,8 @@ async def list_components():
             "components": ["Button", "TextArea", "CheckboxGroup", "Slider"]
         }
     """
-    from agent.state import COMPONENT_SCHEMAS
-
-    return {
-        "components": list(COMPONENT_SCHEMAS.keys()),
-        "schemas": COMPONENT_SCHEMAS
-    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match == "*" or _COMPONENTS_ETAG in if_none_match):
+        return Response(status_code=304, headers=_COMPONENTS_HEADERS)
 
+    return Response(content=_COMPONENTS_BYTES, media_type="application/json", headers=_COMPONENTS_HEADERS)
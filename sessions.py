@@ -10,6 +10,10 @@ Key Concepts:
 2. State = All user data + conversation history for that session
 3. Persistence = In-memory dict (simple for now)
 
+The dict never blocks, so get_session/update_session stay plain functions
+that async handlers can call directly. A networked backend (Redis, a
+database) would have to make them async and be awaited by the routers.
+
 Why Sessions?
 -------------
 Without sessions:
@@ -28,6 +32,7 @@ Future enhancements:
 - Session expiration/cleanup
 """
 
+import logging
 from typing import Dict
 from agent.state import PropalystState, create_propalyst_state
 
@@ -41,6 +46,8 @@ from agent.state import PropalystState, create_propalyst_state
 # Value: PropalystState with all conversation data
 sessions: Dict[str, PropalystState] = {}
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # SESSION MANAGEMENT FUNCTIONS
@@ -74,13 +81,14 @@ def get_session(session_id: str) -> PropalystState:
         >>> state["work_location"]
         "Whitefield"  ← Still there!
     """
-    if session_id not in sessions:
-        print(f"🆕 Creating new session: {session_id}")
-        sessions[session_id] = create_propalyst_state(session_id)
+    state = sessions.get(session_id)
+    if state is None:
+        logger.debug("Creating new session: %s", session_id)
+        state = sessions[session_id] = create_propalyst_state(session_id)
     else:
-        print(f"♻️  Retrieved existing session: {session_id}")
+        logger.debug("Retrieved existing session: %s", session_id)
 
-    return sessions[session_id]
+    return state
 
 
 def update_session(session_id: str, state: PropalystState):
@@ -98,7 +106,7 @@ def update_session(session_id: str, state: PropalystState):
         >>> state["work_location"] = "Whitefield"
         >>> update_session("abc-123", state)  ← Saves changes
     """
-    print(f"💾 Updating session: {session_id}")
+    logger.debug("Updating session: %s", session_id)
     sessions[session_id] = state
 
 
@@ -118,11 +126,10 @@ def delete_session(session_id: str):
         >>> delete_session("abc-123")
         >>> get_session("abc-123")  # Creates new empty session
     """
-    if session_id in sessions:
-        print(f"🗑️  Deleting session: {session_id}")
-        del sessions[session_id]
+    if sessions.pop(session_id, None) is not None:
+        logger.debug("Deleting session: %s", session_id)
     else:
-        print(f"⚠️  Session not found: {session_id}")
+        logger.warning("Session not found: %s", session_id)
 
 
 def list_sessions() -> list[str]:
@@ -0,0 +1,92 @@
+"""
+Application Settings
+====================
+
+All app-level environment reads in one place, evaluated once.
+
+Key Concepts:
+-------------
+1. Settings is a frozen dataclass: plain attribute reads on the hot path
+   (e.g. /health) instead of os.getenv on every request
+2. get_settings() reads the environment on first use, not at import:
+   app_factory.create_app() loads .env before its first call, so .env
+   values are picked up
+3. refresh_settings() re-reads the environment (tests, env changes)
+
+Example:
+--------
+    >>> from settings import get_settings
+    >>> get_settings().cors_origins
+    ('http://localhost:3000', 'http://localhost:3001')
+"""
+
+import os
+import functools
+from dataclasses import dataclass
+from typing import Tuple
+
+
+# Default to multiple localhost ports for development
+DEFAULT_CORS_ORIGINS = "http://localhost:3000,http://localhost:3001,http://localhost:3002,http://localhost:3003"
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    App settings read from the environment (see get_settings).
+
+    Attributes:
+        openai_api_key_set (bool): Whether OPENAI_API_KEY is set
+        cors_origins (tuple): Allowed CORS origins, from CORS_ORIGINS
+        log_level (str): Root log level, from LOG_LEVEL
+        warmup_llm (bool): Send a warmup request to the summary LLM at
+            startup, from WARMUP_LLM
+    """
+    openai_api_key_set: bool
+    cors_origins: Tuple[str, ...]
+    log_level: str
+    warmup_llm: bool
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Read the settings from the environment once.
+
+    Uses environment variables:
+    - OPENAI_API_KEY: only checked for presence
+    - CORS_ORIGINS: comma-separated origins (default: localhost:3000-3003)
+    - LOG_LEVEL: root log level (default: INFO)
+    - WARMUP_LLM: "false" to skip the startup LLM warmup (default: true)
+
+    Returns:
+        Settings: The cached settings
+    """
+    cors_origins_str = os.getenv("CORS_ORIGINS", DEFAULT_CORS_ORIGINS)
+
+    return Settings(
+        openai_api_key_set=bool(os.getenv("OPENAI_API_KEY")),
+        cors_origins=tuple(origin.strip() for origin in cors_origins_str.split(",") if origin.strip()),
+        log_level=os.getenv("LOG_LEVEL", "INFO"),
+        warmup_llm=os.getenv("WARMUP_LLM", "true").lower() not in ("0", "false", "no")
+    )
+
+
+def refresh_settings() -> Settings:
+    """
+    Re-read the settings from the environment and return them.
+
+    Example:
+        >>> os.environ["OPENAI_API_KEY"] = "sk-..."
+        >>> refresh_settings().openai_api_key_set
+        True
+    """
+    get_settings.cache_clear()
+    return get_settings()
+
+
+__all__ = [
+    "Settings",
+    "get_settings",
+    "refresh_settings"
+]
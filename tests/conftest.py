@@ -0,0 +1,43 @@
+"""
+Shared test setup
+=================
+
+Makes the backend modules importable (the tests live one level below
+them) and provides a fake LLM so no test talks to OpenAI.
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class FakeLLM:
+    """
+    Stand-in for ChatOpenAI: answers every prompt with reply(prompt_text).
+
+    Records the prompts it was given (calls for ainvoke, batches for abatch).
+    """
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = []
+        self.batches = []
+
+    async def ainvoke(self, messages, **kwargs):
+        text = messages[-1].content
+        self.calls.append(text)
+        return SimpleNamespace(content=self.reply(text))
+
+    async def abatch(self, inputs, config=None, return_exceptions=False):
+        self.batches.append(inputs)
+        responses = []
+        for messages in inputs:
+            try:
+                responses.append(SimpleNamespace(content=self.reply(messages[-1].content)))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                responses.append(e)
+        return responses
@@ -0,0 +1,59 @@
+"""
+Tests for LLMBatcher (agent/batching.py)
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from agent.batching import LLMBatcher
+from conftest import FakeLLM
+
+
+def _reply(prompt):
+    if prompt == "fail":
+        raise ValueError("bad prompt")
+    return prompt.upper()
+
+
+def test_concurrent_submits_share_one_abatch():
+    llm = FakeLLM(_reply)
+    batcher = LLMBatcher(lambda: llm, max_batch=8, window=0.05)
+
+    async def main():
+        return await asyncio.gather(*(
+            batcher.submit([HumanMessage(content=f"q{i}")]) for i in range(5)
+        ))
+
+    assert asyncio.run(main()) == ["Q0", "Q1", "Q2", "Q3", "Q4"]
+    assert len(llm.batches) == 1
+
+
+def test_batches_are_capped_at_max_batch():
+    llm = FakeLLM(_reply)
+    batcher = LLMBatcher(lambda: llm, max_batch=2, window=0.05)
+
+    async def main():
+        return await asyncio.gather(*(
+            batcher.submit([HumanMessage(content=f"q{i}")]) for i in range(5)
+        ))
+
+    assert asyncio.run(main()) == ["Q0", "Q1", "Q2", "Q3", "Q4"]
+    assert [len(batch) for batch in llm.batches] == [2, 2, 1]
+
+
+def test_failed_prompt_only_fails_its_own_caller():
+    llm = FakeLLM(_reply)
+    batcher = LLMBatcher(lambda: llm, max_batch=8, window=0.05)
+
+    async def main():
+        return await asyncio.gather(
+            batcher.submit([HumanMessage(content="ok")]),
+            batcher.submit([HumanMessage(content="fail")]),
+            return_exceptions=True
+        )
+
+    ok, failed = asyncio.run(main())
+    assert ok == "OK"
+    assert isinstance(failed, ValueError)
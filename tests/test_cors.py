@@ -0,0 +1,95 @@
+"""
+Tests for the pure-ASGI CORS middleware (middleware/cors.py)
+"""
+
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from middleware.cors import FastCORS
+
+ALLOWED = "http://localhost:3000"
+OTHER = "http://evil.example"
+
+
+@pytest.fixture(scope="module")
+def client():
+    app = FastAPI()
+
+    @app.get("/plain")
+    async def plain():
+        return {"ok": True}
+
+    @app.get("/varied")
+    async def varied():
+        return Response("x", headers={"Vary": "Accept-Encoding"})
+
+    app.add_middleware(FastCORS, origins=[ALLOWED])
+    return TestClient(app)
+
+
+# ============================================================================
+# Preflight
+# ============================================================================
+
+def test_preflight_from_allowed_origin(client):
+    response = client.options("/plain", headers={
+        "Origin": ALLOWED,
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "content-type, x-custom",
+    })
+
+    assert response.status_code == 200
+    assert response.text == "OK"
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert "POST" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-allow-headers"] == "content-type, x-custom"
+    assert response.headers["access-control-max-age"] == "600"
+    assert response.headers.get_list("vary") == ["Origin"]
+
+
+def test_preflight_from_other_origin_is_rejected(client):
+    response = client.options("/plain", headers={
+        "Origin": OTHER,
+        "Access-Control-Request-Method": "POST",
+    })
+
+    assert response.status_code == 400
+    assert response.text == "Disallowed CORS origin"
+    assert "access-control-allow-origin" not in response.headers
+
+
+# ============================================================================
+# Simple requests
+# ============================================================================
+
+def test_simple_request_from_allowed_origin(client):
+    response = client.get("/plain", headers={"Origin": ALLOWED})
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers.get_list("vary") == ["Origin"]
+
+
+def test_simple_request_merges_existing_vary(client):
+    response = client.get("/varied", headers={"Origin": ALLOWED})
+
+    assert response.headers.get_list("vary") == ["Accept-Encoding, Origin"]
+
+
+def test_simple_request_from_other_origin_gets_no_cors_headers(client):
+    response = client.get("/plain", headers={"Origin": OTHER})
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+
+
+def test_same_origin_request_is_untouched(client):
+    response = client.get("/plain")
+
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+    assert "vary" not in response.headers
@@ -0,0 +1,50 @@
+"""
+Tests for the scraped-properties cache migration (migrate_cache_schema.py)
+"""
+
+import orjson
+
+import migrate_cache_schema
+
+
+def _cache_paths(tmp_path, monkeypatch):
+    # migrate_cache() looks for data/scraped_properties.json next to the script
+    monkeypatch.setattr(migrate_cache_schema, "__file__", str(tmp_path / "migrate_cache_schema.py"))
+    (tmp_path / "data").mkdir()
+    cache_path = tmp_path / "data" / "scraped_properties.json"
+    return cache_path, cache_path.with_suffix(".backup.json")
+
+
+def test_migrates_to_array_and_keeps_backup(tmp_path, monkeypatch):
+    cache_path, backup_path = _cache_paths(tmp_path, monkeypatch)
+    old = {
+        "https://www.magicbricks.com/a": [{"title": "A"}],
+        "https://www.squareyards.com/b": {"scraped_at": "2025-01-01", "data": [{"title": "B"}]},
+    }
+    cache_path.write_bytes(orjson.dumps(old))
+
+    migrate_cache_schema.migrate_cache()
+
+    new = orjson.loads(cache_path.read_bytes())
+    assert [(e["type"], e["source_url"]) for e in new] == [
+        ("magicbricks", "https://www.magicbricks.com/a"),
+        ("squareyards", "https://www.squareyards.com/b"),
+    ]
+    assert new[1]["scraped_at"] == "2025-01-01"
+    assert new[1]["data"] == [{"title": "B"}]
+    # The backup still holds the old contents after the swap
+    assert orjson.loads(backup_path.read_bytes()) == old
+    # No temp file left behind
+    assert sorted(p.name for p in cache_path.parent.iterdir()) == [
+        "scraped_properties.backup.json", "scraped_properties.json"
+    ]
+
+
+def test_already_migrated_cache_is_left_alone(tmp_path, monkeypatch):
+    cache_path, backup_path = _cache_paths(tmp_path, monkeypatch)
+    cache_path.write_bytes(b"[]")
+
+    migrate_cache_schema.migrate_cache()
+
+    assert cache_path.read_bytes() == b"[]"
+    assert not backup_path.exists()
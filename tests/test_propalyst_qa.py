@@ -0,0 +1,184 @@
+"""
+Tests for the Propalyst answer parsing and validation (agent/nodes/propalyst_qa.py)
+"""
+
+import asyncio
+
+import orjson
+import pytest
+
+from agent.nodes import propalyst_qa
+from agent.nodes.propalyst_qa import (
+    parse_kids_answer,
+    validate_answer_fast,
+    validate_answer_with_llm,
+    extract_multi_field,
+    _check_multi_field,
+)
+from agent.state import create_propalyst_state
+from conftest import FakeLLM
+
+
+@pytest.fixture(autouse=True)
+def clear_validation_cache():
+    propalyst_qa._VALIDATION_CACHE.clear()
+    yield
+    propalyst_qa._VALIDATION_CACHE.clear()
+
+
+# ============================================================================
+# parse_kids_answer / has_kids fast path
+# ============================================================================
+
+@pytest.mark.parametrize("answer", [
+    "No",
+    "nope",
+    "No, I don't have kids",
+    "I have no kids",
+    "Don't have any",
+    "Not yet",
+])
+def test_parse_kids_answer_negatives(answer):
+    assert parse_kids_answer(answer) is False
+
+
+@pytest.mark.parametrize("answer", ["Yes", "yeah", "Yeah I do", "yes, two"])
+def test_parse_kids_answer_positives(answer):
+    assert parse_kids_answer(answer) is True
+
+
+@pytest.mark.parametrize("answer, expected", [
+    ("Yes", True),
+    ("No", False),
+    ("  nope. ", False),
+    ("Yeah", True),
+])
+def test_validate_answer_fast_one_word_kids_answers(answer, expected):
+    result = validate_answer_fast("has_kids", answer)
+    assert result["valid"] is True
+    assert result["extracted_value"] is expected
+
+
+@pytest.mark.parametrize("answer", [
+    "No, I don't have kids",
+    "I have no kids",
+    "Don't have any",
+    "I have 2 kids",
+])
+def test_validate_answer_fast_sends_kids_sentences_to_llm(answer):
+    assert validate_answer_fast("has_kids", answer) is None
+
+
+# ============================================================================
+# Numeric fast paths
+# ============================================================================
+
+@pytest.mark.parametrize("field, answer, expected", [
+    ("commute_time_max", "45 min", 45),
+    ("commute_time_max", "1 hour", 60),
+    ("budget_max", "80k", 80000),
+    ("budget_max", "₹75,000", 75000),
+    ("budget_max", "1.5 lakh", 150000),
+    ("property_type", "villa", "Villa"),
+])
+def test_validate_answer_fast_clean_answers(field, answer, expected):
+    assert validate_answer_fast(field, answer)["extracted_value"] == expected
+
+
+@pytest.mark.parametrize("field, answer", [
+    ("commute_time_max", "500"),         # out of range
+    ("commute_time_max", "around 20"),   # not a clean number
+    ("budget_max", "5000"),              # out of range
+    ("work_location", "Whitefield"),     # always validated by the LLM
+])
+def test_validate_answer_fast_defers_to_llm(field, answer):
+    assert validate_answer_fast(field, answer) is None
+
+
+# ============================================================================
+# Validation cache
+# ============================================================================
+
+def test_validate_answer_with_llm_caches_results(monkeypatch):
+    llm = FakeLLM(lambda prompt: '{"valid": true, "extracted_value": "Whitefield", "message": "Great!"}')
+    monkeypatch.setattr(propalyst_qa, "get_llm", lambda: llm)
+    state = create_propalyst_state("test")
+
+    first = asyncio.run(validate_answer_with_llm("work_location", "whitefield", state))
+    second = asyncio.run(validate_answer_with_llm("work_location", "  Whitefield ", state))
+
+    assert first == second
+    assert first["extracted_value"] == "Whitefield"
+    assert len(llm.calls) == 1
+
+
+# ============================================================================
+# Multi-field extraction
+# ============================================================================
+
+def test_check_multi_field_keeps_only_sane_values():
+    checked = _check_multi_field({
+        "work_location": "  Whitefield ",
+        "has_kids": "yes",               # not a bool
+        "commute_time_max": 30,
+        "property_type": "Castle",       # not an option
+        "budget_max": 80000,
+    })
+    assert checked == {"work_location": "Whitefield", "commute_time_max": 30, "budget_max": 80000}
+
+
+@pytest.mark.parametrize("data", [
+    {"work_location": "   "},
+    {"has_kids": None},
+    {"commute_time_max": True},          # bool is not a commute time
+    {"commute_time_max": 500},
+    {"budget_max": 5000},
+    {"budget_max": "80k"},
+])
+def test_check_multi_field_drops_invalid_values(data):
+    assert _check_multi_field(data) == {}
+
+
+def _multi_field_llm(location, location_valid):
+    def reply(prompt):
+        if "Extract every preference" in prompt:
+            return orjson.dumps({
+                "work_location": location,
+                "has_kids": False,
+                "commute_time_max": None,
+                "property_type": "Apartment",
+                "budget_max": 80000,
+            }).decode()
+        # Per-field work_location validation
+        return orjson.dumps({
+            "valid": location_valid,
+            "extracted_value": location.title() if location_valid else None,
+            "message": "ok",
+        }).decode()
+    return FakeLLM(reply)
+
+
+def test_extract_multi_field_validates_work_location(monkeypatch):
+    monkeypatch.setattr(propalyst_qa, "get_llm", lambda: _multi_field_llm("whitefield", True))
+    state = create_propalyst_state("test")
+
+    updated = asyncio.run(extract_multi_field(state, "I work in whitefield, no kids, flat under 80k"))
+
+    assert updated["work_location"] == "Whitefield"
+    assert updated["has_kids"] is False
+    assert updated["property_type"] == "Apartment"
+    assert updated["budget_max"] == 80000
+    # The caller's state is left untouched
+    assert state["work_location"] is None
+    assert state["messages"] == []
+
+
+def test_extract_multi_field_drops_unknown_work_location(monkeypatch):
+    monkeypatch.setattr(propalyst_qa, "get_llm", lambda: _multi_field_llm("London", False))
+    state = create_propalyst_state("test")
+
+    updated = asyncio.run(extract_multi_field(state, "I work in London, flat under 80k"))
+
+    assert updated["work_location"] is None
+    assert updated["budget_max"] == 80000
+    assert "work location" not in updated["message"]
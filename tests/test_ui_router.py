@@ -0,0 +1,96 @@
+"""
+Tests for the UI router endpoints that don't need an LLM (routers/ui_router.py)
+"""
+
+import asyncio
+import importlib
+
+import pytest
+from fastapi.testclient import TestClient
+
+import graphs
+from app_factory import create_app
+
+# The module, not the APIRouter that routers/__init__.py re-exports under the same name
+ui_router = importlib.import_module("routers.ui_router")
+
+
+@pytest.fixture(scope="module")
+def client():
+    # No `with`: the lifespan (graph compilation, LLM warmup) isn't needed,
+    # create_app() registers every route up front
+    return TestClient(create_app())
+
+
+def test_components_sends_etag(client):
+    response = client.get("/api/components")
+
+    assert response.status_code == 200
+    assert "Button" in response.json()["components"]
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+
+def test_components_etag_round_trip(client):
+    etag = client.get("/api/components").headers["etag"]
+
+    response = client.get("/api/components", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_components_wildcard_if_none_match(client):
+    response = client.get("/api/components", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 304
+
+
+def test_components_stale_etag_gets_full_body(client):
+    response = client.get("/api/components", headers={"If-None-Match": '"stale"'})
+
+    assert response.status_code == 200
+    assert response.json()["components"]
+
+
+def test_identical_concurrent_requests_share_one_graph_run(monkeypatch):
+    runs = []
+
+    class SlowGraph:
+        async def ainvoke(self, state):
+            runs.append(state["user_input"])
+            await asyncio.sleep(0.01)
+            return {"component": None, "message": state["user_input"]}
+
+    monkeypatch.setattr(graphs, "get_ui_generator_graph", lambda: SlowGraph())
+
+    async def main():
+        return await asyncio.gather(
+            ui_router._run_ui_graph("A button"),
+            ui_router._run_ui_graph("  a   BUTTON "),
+            ui_router._run_ui_graph("a slider"),
+        )
+
+    first, second, third = asyncio.run(main())
+    assert first is second
+    assert third["message"] == "a slider"
+    assert runs == ["A button", "a slider"]
+    assert ui_router._inflight == {}
+
+
+def test_generate_ui_stream_sends_sse_events(client, monkeypatch):
+    async def fake_stream(user_input):
+        yield {"event": "token", "data": '{"type": '}
+        yield {"event": "component", "data": {"type": "Button", "props": {"label": user_input}}}
+
+    monkeypatch.setattr(ui_router, "stream_ui_component", fake_stream)
+
+    response = client.post("/api/generate-ui/stream", json={"user_input": "Go"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == (
+        'event: token\ndata: "{\\"type\\": "\n\n'
+        'event: component\ndata: {"type":"Button","props":{"label":"Go"}}\n\n'
+    )